@@ -23,7 +23,7 @@ from openai.types.beta.threads.runs.run_step import (
     RunStep,
     Usage,
 )
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from marvin.beta.assistants.handlers import PrintHandler
 from marvin.beta.local.assistant import LocalAssistant
@@ -96,6 +96,8 @@ class LocalRun(BaseModel, ExposeSyncMethodsMixin):
         description="Cache for the run. Replace with a redis based cached to allow for messaging.",
     )
 
+    _tool_lookup: Dict[str, Tool] = PrivateAttr(default_factory=dict)
+
     class Config:
         arbitrary_types_allowed = True
 
@@ -109,6 +111,7 @@ class LocalRun(BaseModel, ExposeSyncMethodsMixin):
             if self.tools and len(self.tools) > 0
             else None
         )
+        self._tool_lookup = {t.name: t for t in self.tools or []}
 
     async def _check_complete(self):
         """
@@ -334,7 +337,7 @@ class LocalRun(BaseModel, ExposeSyncMethodsMixin):
             if tool_call.function.name == "end_run":
                 raise EndRun()
 
-            tool_result = await handle_tool_call_async(tool_call, self.tools)
+            tool_result = await handle_tool_call_async(tool_call, self._tool_lookup)
             output_string = (
                 output_to_string(tool_result)
                 if not hasattr(tool_result, "results_string")
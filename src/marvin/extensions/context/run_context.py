@@ -1,5 +1,6 @@
 import uuid
 from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any, List
 
 from asgiref.local import Local
@@ -23,6 +24,11 @@ from .scoped_context import ctx
 _async_local = Local()
 _async_local.ctx = {}
 
+# per-run state is read on every tool call; plain context vars avoid the
+# locking Local does on each attribute access
+_run_contexts: ContextVar[dict | None] = ContextVar("run_contexts", default=None)
+_current_run_id: ContextVar[str | None] = ContextVar("current_run_id", default=None)
+
 
 class RunContextToolkitConfig(BaseModel):
     toolkit_id: str | uuid.UUID | None = None
@@ -180,9 +186,11 @@ def add_run_context(context: dict, run_id: str):
     """Add context to thread."""
     set_current_run_id(run_id)
 
-    if not hasattr(_async_local, "run_context"):
-        _async_local.run_context = {}
-    _async_local.run_context[run_id] = context
+    contexts = _run_contexts.get()
+    if contexts is None:
+        contexts = {}
+        _run_contexts.set(contexts)
+    contexts[run_id] = context
 
 
 def get_run_context(
@@ -193,9 +201,7 @@ def get_run_context(
     if run_id is None:
         return None
 
-    if not hasattr(_async_local, "run_context"):
-        _async_local.run_context = {}
-    c = _async_local.run_context.get(run_id, {})
+    c = (_run_contexts.get() or {}).get(run_id, {})
     if as_class:
         return RunContext(**c)
     return c
@@ -203,24 +209,21 @@ def get_run_context(
 
 def get_current_run_id() -> str | None:
     """Get current run id."""
-    if not hasattr(_async_local, "run_id"):
-        return None
-    return _async_local.run_id
+    return _current_run_id.get()
 
 
 def set_current_run_id(run_id: str):
     """Set current run id."""
-    if not hasattr(_async_local, "run_id"):
-        _async_local.run_id = None
-    _async_local.run_id = run_id
+    _current_run_id.set(run_id)
 
 
 def clear_run_context(run_id: str):
     """Clear run context."""
-    if hasattr(_async_local, "run_context"):
-        del _async_local.run_context[run_id]
-    if hasattr(_async_local, "run_id") and _async_local.run_id == run_id:
-        del _async_local.run_id
+    contexts = _run_contexts.get()
+    if contexts is not None:
+        contexts.pop(run_id, None)
+    if _current_run_id.get() == run_id:
+        _current_run_id.set(None)
 
 
 def get_global_context() -> dict:
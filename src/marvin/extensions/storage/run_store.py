@@ -1,11 +1,89 @@
+import atexit
+import queue
+import threading
+import time
 from typing import Any, List, Optional, Tuple
 
 from marvin.extensions.storage.base import BaseStorage
 from marvin.extensions.storage.redis_base import RedisBase
 from marvin.extensions.types import PersistedRun
+from marvin.extensions.utilities.logging import logger
 from marvin.utilities.asyncio import ExposeSyncMethodsMixin, expose_sync_method
 
 
+class RunSaveQueue:
+    """
+    Background writer for run saves.
+
+    Saves are queued from the calling thread and written by a single daemon
+    thread in batches. Repeated saves of the same run within a batch are
+    collapsed into one write of its latest state.
+    """
+
+    def __init__(self, batch_size: int = 50, max_wait: float = 0.1):
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def put(self, store: "BaseRunStore", run: PersistedRun) -> threading.Event:
+        """
+        Queue a snapshot of the run. The returned event is set once this
+        save has been written (or has failed).
+        """
+        self._ensure_worker()
+        written = threading.Event()
+        self._queue.put((store, run.model_dump(), written))
+        return written
+
+    def flush(self) -> None:
+        """Block until every queued save has been written."""
+        self._queue.join()
+
+    def _ensure_worker(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._work, name="marvin-run-saves", daemon=True
+                )
+                self._thread.start()
+
+    def _work(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            try:
+                self._save_batch(batch)
+            except Exception as e:
+                logger.error(f"Failed to save runs: {e}")
+            finally:
+                for _, _, written in batch:
+                    written.set()
+                    self._queue.task_done()
+
+    def _save_batch(self, batch: List[Tuple["BaseRunStore", dict, Any]]) -> None:
+        pending = {}
+        for store, data, _ in batch:
+            pending.setdefault(id(store), (store, {}))[1][data.get("id")] = data
+        for store, runs in pending.values():
+            store.save_runs([PersistedRun.model_validate(r) for r in runs.values()])
+
+
+run_save_queue = RunSaveQueue()
+atexit.register(run_save_queue.flush)
+
+
 class BaseRunStore(BaseStorage[PersistedRun], ExposeSyncMethodsMixin):
     """
     Interface for run storage classes.
@@ -15,6 +93,21 @@ class BaseRunStore(BaseStorage[PersistedRun], ExposeSyncMethodsMixin):
     async def save_run_async(self, run: PersistedRun) -> None:
         raise NotImplementedError("save_run not implemented")
 
+    @expose_sync_method("save_runs")
+    async def save_runs_async(self, runs: List[PersistedRun]) -> None:
+        for run in runs:
+            await self.save_run_async(run)
+
+    def enqueue(self, run: PersistedRun) -> threading.Event:
+        """
+        Save the run in the background. The run is snapshotted when queued,
+        later changes to it are not saved unless it is queued again.
+
+        Wait on the returned event for this save, or use
+        `run_save_queue.flush()` to wait for every queued save.
+        """
+        return run_save_queue.put(self, run)
+
     @expose_sync_method("get_run")
     async def get_run_async(self, run_id: str) -> Optional[PersistedRun]:
         raise NotImplementedError("get_run not implemented")
@@ -167,6 +260,13 @@ class RedisRunStore(BaseRunStore, RedisBase):
     async def save_run_async(self, run: PersistedRun) -> None:
         self.redis_client.set(f"run:{run.id}", run.model_dump_json())
 
+    @expose_sync_method("save_runs")
+    async def save_runs_async(self, runs: List[PersistedRun]) -> None:
+        pipe = self.redis_client.pipeline()
+        for run in runs:
+            pipe.set(f"run:{run.id}", run.model_dump_json())
+        pipe.execute()
+
     @expose_sync_method("get_run")
     async def get_run_async(self, run_id: str) -> Optional[PersistedRun]:
         run_data = self.redis_client.get(f"run:{run_id}")
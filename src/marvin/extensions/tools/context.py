@@ -20,11 +20,12 @@ def tool_run_context(
     toolkit_id: str | uuid.UUID | None = None,
     db_id: str | uuid.UUID | None = None,
     run_store_class: BaseRunStore | None = InMemoryRunStore,
+    run_store: BaseRunStore | None = None,
 ):
     run_id = str(uuid.uuid4())
     tenant_id = get_current_tenant_id()
 
-    run_store = run_store_class() or InMemoryRunStore()
+    run_store = run_store or run_store_class() or InMemoryRunStore()
 
     # Create run object in the database
     persisted_run = PersistedRun(
@@ -38,7 +39,6 @@ def tool_run_context(
             "toolkit_id": toolkit_id,
         },
     )
-    run_store.save_run(persisted_run)
 
     # Create run context
     context = RunContext(
@@ -63,12 +63,13 @@ def tool_run_context(
         yield persisted_run, _c
     except Exception as e:
         persisted_run.status = "failed"
-        run_store.save_run(persisted_run)
         raise e
-    finally:
-        # Update run status
+    else:
         persisted_run.status = "completed"
-        run_store.save_run(persisted_run)
+    finally:
+        # saved once per tool call with its final status and outputs; only
+        # this run's write is waited on so it is readable after the context
+        run_store.enqueue(persisted_run).wait()
         clear_run_context(run_id)
 
 
@@ -1,17 +1,17 @@
+import copy
 import functools
 import inspect
 import json
 import logging
+import sys
 import traceback
+import types
 import typing
 import uuid
-from typing import Annotated, Any, Callable, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Annotated, Any, Callable, Dict, List, Optional, Union
 
-import langchain_core.tools
 import pydantic
-import pydantic.v1
 from langchain_core.messages import InvalidToolCall, ToolCall
-from litellm import ChatCompletionMessageToolCall
 from pydantic import (
     BaseModel,
     Field,
@@ -23,9 +23,38 @@ from pydantic import (
 from marvin.utilities.asyncio import run_sync_if_awaitable
 from marvin.utilities.tools import Function, ModelSchemaGenerator
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    import langchain_core.tools
+    from litellm import ChatCompletionMessageToolCall
+
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _cached_config_schema(config_cls: type[BaseModel]) -> dict:
+    return config_cls.model_json_schema(schema_generator=ModelSchemaGenerator)
+
+
+def _config_schema(config_cls: type[BaseModel]) -> dict:
+    # copy so callers can't mutate the cached schema shared across tools
+    return copy.deepcopy(_cached_config_schema(config_cls))
+
+
+def _lc_base_tool() -> type | tuple:
+    """
+    Returns langchain's BaseTool for isinstance checks without importing
+    langchain_core.tools. If the module was never imported, no BaseTool
+    instance can exist and an empty tuple (which matches nothing) is returned.
+    """
+    module = sys.modules.get("langchain_core.tools")
+    return module.BaseTool if module is not None else ()
+
+
 class Tool(BaseModel):
     name: str = Field(description="The name of the tool")
     description: str = Field(
@@ -74,32 +103,16 @@ class Tool(BaseModel):
         return dict(type="function", function=payload)
 
     def run(self, input: dict):
-        print(f"Running tool {self.name} with input {input}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Running tool {self.name} with input {input}")
         result = self.fn(**input)
         result = run_sync_if_awaitable(result)
-
-        # prepare artifact
-        passed_args = inspect.signature(self.fn).bind(**input).arguments
-        try:
-            # try to pretty print the args
-            passed_args = json.dumps(passed_args, indent=2)
-        except Exception:
-            pass
-
         return result
 
     async def run_async(self, input: dict):
         result = self.fn(**input)
         if inspect.isawaitable(result):
             result = await result
-
-        # prepare artifact
-        passed_args = inspect.signature(self.fn).bind(**input).arguments
-        try:
-            # try to pretty print the args
-            passed_args = json.dumps(passed_args, indent=2)
-        except Exception:
-            pass
         return result
 
     @classmethod
@@ -200,8 +213,8 @@ class Tool(BaseModel):
 
         if config and not isinstance(config, dict):
             try:
-                tool.settings = config.model_json_schema(
-                    schema_generator=ModelSchemaGenerator
+                tool.settings = _config_schema(
+                    config if isinstance(config, type) else type(config)
                 )
 
             except Exception:
@@ -212,7 +225,7 @@ class Tool(BaseModel):
         return tool
 
     @classmethod
-    def from_lc_tool(cls, tool: langchain_core.tools.BaseTool, **kwargs):
+    def from_lc_tool(cls, tool: "langchain_core.tools.BaseTool", **kwargs):
         fn = tool._run
         return cls(
             name=tool.name,
@@ -266,9 +279,21 @@ class ApiTool(Tool):
 
     @classmethod
     def from_tool(cls, tool: Tool):
-        dict_tool = tool.model_dump()
-        dict_tool["fn"] = None
-        return cls(**dict_tool)
+        """
+        Build an ApiTool from an already validated tool without a
+        `model_dump` / re-validation round trip.
+
+        Dicts and lists are copied so the ApiTool does not share config,
+        metadata or schemas with the registered tool.
+        """
+        values = {}
+        for k in cls.model_fields:
+            if hasattr(tool, k):
+                v = getattr(tool, k)
+                values[k] = v.copy() if isinstance(v, (dict, list)) else v
+        values["fn"] = None
+        fields_set = (tool.model_fields_set & cls.model_fields.keys()) | {"fn"}
+        return cls.model_construct(_fields_set=fields_set, **values)
 
     @classmethod
     def as_tool(cls, tool: Tool):
@@ -314,52 +339,91 @@ def tool(
     return Tool.from_function(fn, name=name, description=description, **kwargs)
 
 
+def _as_is(t: Any) -> Any:
+    return t
+
+
+def _invalid_tool(t: Any, *args: Any) -> Any:
+    raise ValueError(f"Invalid tool: {t}")
+
+
+def _resolve_tool_converter(cls: type) -> Callable[[Any], Tool]:
+    if issubclass(cls, Tool):
+        return _as_is
+    elif issubclass(cls, _lc_base_tool()):
+        return Tool.from_lc_tool
+    elif issubclass(cls, types.FunctionType):
+        return Tool.from_function
+    elif issubclass(cls, dict):
+        return Tool.model_validate
+    return _invalid_tool
+
+
+def _resolve_lc_converter(cls: type) -> Callable[[Any], Any]:
+    from langchain_core.tools import BaseTool, StructuredTool
+
+    if issubclass(cls, BaseTool):
+        return _as_is
+    elif issubclass(cls, Tool):
+        return Tool.to_lc_tool
+    elif issubclass(cls, types.FunctionType):
+        return StructuredTool.from_function
+    return _invalid_tool
+
+
+# type -> converter, filled on first sight of each concrete type so repeat
+# conversions are a single dict lookup instead of an isinstance chain
+_TOOL_CONVERTERS: Dict[type, Callable[[Any], Tool]] = {}
+_LC_CONVERTERS: Dict[type, Callable[[Any], Any]] = {}
+
+
+def _converter(
+    table: Dict[type, Callable], cls: type, resolve: Callable[[type], Callable]
+) -> Callable:
+    converter = table.get(cls)
+    if converter is None:
+        converter = table[cls] = resolve(cls)
+    return converter
+
+
+def _normalize(t: Union[Callable, "langchain_core.tools.BaseTool", Tool, dict]) -> Tool:
+    return _converter(_TOOL_CONVERTERS, type(t), _resolve_tool_converter)(t)
+
+
+def _fn_identity(fn: Optional[Callable]) -> tuple[int, int]:
+    # bound methods are recreated on every attribute access, so key them on
+    # the underlying function and instance rather than the method object
+    return id(getattr(fn, "__self__", None)), id(getattr(fn, "__func__", fn))
+
+
 def as_tools(
-    tools: List[Union[Callable, langchain_core.tools.BaseTool, Tool]],
+    tools: List[Union[Callable, "langchain_core.tools.BaseTool", Tool]],
 ) -> List[Tool]:
     """
     Converts a list of tools (either Tool objects or callables) into a list of
     Tool objects.
 
-    If duplicate tools are found, where the name, function, and coroutine are
-    the same, only one is kept.
+    If duplicate tools are found, where the name and function are the same,
+    only one is kept.
     """
     seen = set()
     new_tools = []
     for t in tools:
-        if isinstance(t, Tool):
-            continue
-        elif isinstance(t, langchain_core.tools.BaseTool):
-            t = Tool.from_lc_tool(t)
-        elif inspect.isfunction(t):
-            t = Tool.from_function(t)
-        elif isinstance(t, dict):
-            t = Tool(**t)
-        else:
-            raise ValueError(f"Invalid tool: {t}")
-
-        if (t.name, t.description) in seen:
+        t = _normalize(t)
+        key = (t.name, *_fn_identity(t.fn))
+        if key in seen:
             continue
+        seen.add(key)
         new_tools.append(t)
-        seen.add((t.name, t.description))
     return new_tools
 
 
 def as_lc_tools(
-    tools: List[Union[Callable, langchain_core.tools.BaseTool, Tool]],
-) -> List[langchain_core.tools.BaseTool]:
-    new_tools = []
-    for t in tools:
-        if isinstance(t, langchain_core.tools.BaseTool):
-            continue
-        elif isinstance(t, Tool):
-            t = t.to_lc_tool()
-        elif inspect.isfunction(t):
-            t = langchain_core.tools.StructuredTool.from_function(t)
-        else:
-            raise ValueError(f"Invalid tool: {t}")
-        new_tools.append(t)
-    return new_tools
+    tools: List[Union[Callable, "langchain_core.tools.BaseTool", Tool]],
+) -> List["langchain_core.tools.BaseTool"]:
+    return [
+        _converter(_LC_CONVERTERS, type(t), _resolve_lc_converter)(t) for t in tools
+    ]
 
 
 def output_to_string(output: Any) -> str:
@@ -376,6 +440,42 @@ def output_to_string(output: Any) -> str:
         return str(output)
 
 
+def _run_tool(tool: Tool, args: dict) -> Any:
+    return tool.run(input=args)
+
+
+async def _run_tool_async(tool: Tool, args: dict) -> Any:
+    return await tool.run_async(input=args)
+
+
+def _invoke_lc_tool(tool: "langchain_core.tools.BaseTool", args: dict) -> Any:
+    return tool.invoke(input=args)
+
+
+async def _ainvoke_lc_tool(tool: "langchain_core.tools.BaseTool", args: dict) -> Any:
+    return await tool.ainvoke(input=args)
+
+
+def _resolve_invoker(cls: type) -> Callable[[Any, dict], Any]:
+    if issubclass(cls, Tool):
+        return _run_tool
+    elif issubclass(cls, _lc_base_tool()):
+        return _invoke_lc_tool
+    return _invalid_tool
+
+
+def _resolve_async_invoker(cls: type) -> Callable[[Any, dict], Any]:
+    if issubclass(cls, Tool):
+        return _run_tool_async
+    elif issubclass(cls, _lc_base_tool()):
+        return _ainvoke_lc_tool
+    return _invalid_tool
+
+
+_INVOKERS: Dict[type, Callable[[Any, dict], Any]] = {}
+_ASYNC_INVOKERS: Dict[type, Callable[[Any, dict], Any]] = {}
+
+
 class ToolResult(BaseModel):
     tool_call_id: str
     result: Any = Field(exclude=True, repr=False)
@@ -385,98 +485,111 @@ class ToolResult(BaseModel):
     end_turn: bool = False
 
 
+def _load_arguments(arguments: str | dict | None) -> dict:
+    if isinstance(arguments, dict):
+        return arguments
+    if not arguments:
+        return {}
+    if orjson is not None:
+        return orjson.loads(arguments)
+    return json.loads(arguments)
+
+
+def _resolve_tool_call(
+    tool_call: Union[ToolCall, InvalidToolCall, "ChatCompletionMessageToolCall"],
+    tools: List[Tool] | Dict[str, Tool],
+) -> tuple[str, str, Any, dict | None, str | None]:
+    """
+    Shared lookup for handle_tool_call and handle_tool_call_async. `tools` may
+    be a prebuilt {name: tool} mapping so callers dispatching many calls
+    against the same tools don't rebuild it per call.
+
+    Returns (tool_call_id, fn_name, tool, fn_args, error). `tool` is None and
+    `error` is set when the call can not be run.
+    """
+    if isinstance(tool_call, dict):
+        call_id, fn_name = tool_call["id"], tool_call["name"]
+        raw_args = tool_call["args"]
+    else:
+        # litellm / openai ChatCompletionMessageToolCall
+        call_id, fn_name = tool_call.id, tool_call.function.name
+        raw_args = tool_call.function.arguments
+
+    tool_lookup = tools if isinstance(tools, dict) else {t.name: t for t in tools}
+    tool = tool_lookup.get(fn_name)
+    if tool is None:
+        return call_id, fn_name, None, None, f'Function "{fn_name}" not found.'
+    try:
+        fn_args = _load_arguments(raw_args)
+    except Exception as exc:
+        return (
+            call_id,
+            fn_name,
+            None,
+            None,
+            f'Error calling function "{fn_name}": {exc}',
+        )
+    return call_id, fn_name, tool, fn_args, None
+
+
+def _tool_result(
+    call_id: str, tool: Any, fn_output: Any, is_error: bool, end_turn: bool
+) -> ToolResult:
+    return ToolResult(
+        tool_call_id=call_id,
+        result=fn_output,
+        str_result=output_to_string(fn_output),
+        is_error=is_error,
+        is_private=getattr(tool, "private", tool is None),
+        end_turn=end_turn,
+    )
+
+
 def handle_tool_call(
-    tool_call: Union[ToolCall, InvalidToolCall], tools: List[Tool]
+    tool_call: Union[ToolCall, InvalidToolCall], tools: List[Tool] | Dict[str, Tool]
 ) -> Any:
     """
     Given a ToolCall and set of available tools, runs the tool call and returns
     a ToolResult object,
     """
-    is_error = False
-    is_private = False
+    call_id, fn_name, tool, fn_args, fn_output = _resolve_tool_call(tool_call, tools)
+    is_error = tool is None
     end_turn = False
-    tool = None
-    tool_lookup = {t.name: t for t in tools}
-    fn_name = tool_call["name"]
-
-    if fn_name not in tool_lookup:
-        fn_output = f'Function "{fn_name}" not found.'
-        is_error = True
-        is_private = True
 
     if not is_error:
         try:
-            tool = tool_lookup[fn_name]
-            fn_args = tool_call["args"]
-            if isinstance(tool, Tool):
-                fn_output = tool.run(input=fn_args)
-                end_turn = tool.end_turn
-            elif isinstance(tool, langchain_core.tools.BaseTool):
-                fn_output = tool.invoke(input=fn_args)
-            else:
-                raise ValueError(f"Invalid tool: {tool}")
+            invoke = _converter(_INVOKERS, type(tool), _resolve_invoker)
+            fn_output = invoke(tool, fn_args)
+            end_turn = getattr(tool, "end_turn", False)
         except Exception as exc:
             fn_output = f'Error calling function "{fn_name}": {exc}'
             is_error = True
 
-    return ToolResult(
-        tool_call_id=tool_call["id"],
-        result=fn_output,
-        str_result=output_to_string(fn_output),
-        is_error=is_error,
-        is_private=getattr(tool, "private", is_private),
-        end_turn=end_turn,
-    )
+    return _tool_result(call_id, tool, fn_output, is_error, end_turn)
 
 
 async def handle_tool_call_async(
-    tool_call: ToolCall | ChatCompletionMessageToolCall, tools: List[Tool]
+    tool_call: Union[ToolCall, "ChatCompletionMessageToolCall"],
+    tools: List[Tool] | Dict[str, Tool],
 ) -> ToolResult:
     """
     Given a ToolCall and set of available tools, runs the tool call and returns
     a ToolResult object
     """
-    if isinstance(tool_call, ChatCompletionMessageToolCall):
-        tool_call = ToolCall(
-            id=tool_call.id,
-            name=tool_call.function.name,
-            args=json.loads(tool_call.function.arguments),
-        )
-    is_error = False
-    is_private = False
+    call_id, fn_name, tool, fn_args, fn_output = _resolve_tool_call(tool_call, tools)
+    is_error = tool is None
     end_turn = False
-    tool = None
-    tool_lookup = {t.name: t for t in tools}
-    fn_name = tool_call["name"]
-
-    if fn_name not in tool_lookup:
-        fn_output = f'Function "{fn_name}" not found.'
-        is_error = True
-        is_private = True
 
     if not is_error:
         try:
-            tool = tool_lookup[fn_name]
-            fn_args = tool_call["args"]
-            if isinstance(tool, Tool):
-                fn_output = await tool.run_async(input=fn_args)
-                end_turn = tool.end_turn
-            elif isinstance(tool, langchain_core.tools.BaseTool):
-                fn_output = await tool.ainvoke(input=fn_args)
-            else:
-                raise ValueError(f"Invalid tool: {tool}")
+            invoke = _converter(_ASYNC_INVOKERS, type(tool), _resolve_async_invoker)
+            fn_output = await invoke(tool, fn_args)
+            end_turn = getattr(tool, "end_turn", False)
         except Exception as exc:
             fn_output = f'Error calling function "{fn_name}": {exc}'
             is_error = True
 
-    return ToolResult(
-        tool_call_id=tool_call["id"],
-        result=fn_output,
-        str_result=output_to_string(fn_output),
-        is_error=is_error,
-        is_private=getattr(tool, "private", is_private),
-        end_turn=end_turn,
-    )
+    return _tool_result(call_id, tool, fn_output, is_error, end_turn)
 
 
 def get_config_from_context(
@@ -498,7 +611,7 @@ def get_config_from_context(
     context = get_run_context()
     if not context:
         return {}
-    tool_configs = context.get("tool_config", [])
+    tool_configs = context.get("tool_config") or []
     config_keys = config_key if isinstance(config_key, list) else [config_key]
     for config_key in config_keys:
         for toolkit_config in tool_configs:
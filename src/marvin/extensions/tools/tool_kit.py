@@ -1,9 +1,9 @@
-from typing import List, Literal
+from typing import Dict, List, Literal
 
-from pydantic import BaseModel, Field, computed_field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, computed_field, model_validator
 
 from marvin.extensions.tools.tool import ApiTool, Tool
-from marvin.extensions.types.base import BaseModelConfig
+from marvin.extensions.types.base import BASE_CONFIG
 
 
 class ToolkitTokenIntegration(BaseModel):
@@ -51,8 +51,10 @@ class Toolkit(BaseModel):
         description="List of integrations for the toolkit", default=None
     )
 
-    class Config(BaseModelConfig):
-        pass
+    _tool_list_cache: List[ApiTool] | None = PrivateAttr(None)
+    _tool_index_cache: Dict[str, ApiTool] | None = PrivateAttr(None)
+
+    model_config = BASE_CONFIG
 
     @model_validator(mode="after")
     def validate_tools(self):
@@ -72,7 +74,37 @@ class Toolkit(BaseModel):
     def actions(self) -> int:
         return len(self.tools)
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in ("tools", "tool_ids"):
+            self._invalidate_tool_cache()
+
+    def model_copy(self, *, update=None, deep: bool = False):
+        copy = super().model_copy(update=update, deep=deep)
+        copy._invalidate_tool_cache()
+        return copy
+
+    def _invalidate_tool_cache(self):
+        self._tool_list_cache = None
+        self._tool_index_cache = None
+
+    def _tool_index(self) -> Dict[str, ApiTool]:
+        if self._tool_index_cache is None:
+            index = {}
+            for t in self.to_tool_list():
+                if t is not None:
+                    index.setdefault(t.name, t)
+            self._tool_index_cache = index
+        return self._tool_index_cache
+
     def to_tool_list(self) -> List[ApiTool]:
+        """
+        Tools in the toolkit. Built once and cached until `tools` or
+        `tool_ids` change; callers get a copy of the cached list.
+        """
+        if self._tool_list_cache is not None:
+            return list(self._tool_list_cache)
+
         tools = []
         from .helpers import get_tool  # noqa
 
@@ -80,39 +112,33 @@ class Toolkit(BaseModel):
             tools.extend(self.tools)
         if self.tool_ids is not None:
             tools.extend([get_tool(tool_id) for tool_id in self.tool_ids])
-        return tools
+        self._tool_list_cache = tools
+        return list(tools)
 
     def to_runnable_tool_list(self) -> List[Tool]:
-        tools = []
-        from .helpers import get_tool  # noqa
-
-        if self.tools is not None:
-            tools.extend(self.tools)
-        if self.tool_ids is not None:
-            tools.extend([get_tool(tool_id) for tool_id in self.tool_ids])
-        return tools
+        return self.to_tool_list()
 
     def list_tools(self) -> List[str]:
         return [t.name for t in self.to_tool_list()]
 
     def get_tool(self, tool_name: str) -> ApiTool:
-        for t in self.to_tool_list():
-            if t.name == tool_name:
-                return t
-        raise ValueError(f"Tool '{tool_name}' not found in toolkit.")
+        tool = self._tool_index().get(tool_name)
+        if tool is None:
+            raise ValueError(f"Tool '{tool_name}' not found in toolkit.")
+        return tool
 
     def get_runnable_tool(self, tool_name: str) -> Tool:
         from .app_tools import get_tool_by_name
 
-        for t in self.to_runnable_tool_list():
-            if t.name == tool_name:
-                return get_tool_by_name(tool_name)
-        raise ValueError(f"Tool '{tool_name}' not found in toolkit.")
+        if tool_name not in self._tool_index():
+            raise ValueError(f"Tool '{tool_name}' not found in toolkit.")
+        return get_tool_by_name(tool_name)
 
     def add_tool(self, tool: ApiTool):
         if isinstance(tool, Tool):
-            tool = ApiTool(**tool.model_dump())
+            tool = ApiTool.from_tool(tool)
         self.tools.append(tool)
+        self._invalidate_tool_cache()
 
     def remove_tool(self, tool_name: str):
         self.tools = [t for t in self.tools if t.name != tool_name]
@@ -136,7 +162,7 @@ class Toolkit(BaseModel):
             name=name,
             id=id,
             description=description,
-            tools=[ApiTool(**t.model_dump()) for t in tools],
+            tools=[ApiTool.from_tool(t) for t in tools],
             requires_config=requires_config,
             config=config,
             config_schema=config_schema,
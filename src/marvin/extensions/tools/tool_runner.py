@@ -1,3 +1,4 @@
+import logging
 import uuid
 
 from pydantic import BaseModel
@@ -9,6 +10,8 @@ from marvin.extensions.tools.tool import Tool as DBTool
 from marvin.extensions.tools.tool import ToolCall, handle_tool_call
 from marvin.extensions.utilities.serialization import to_serializable
 
+logger = logging.getLogger(__name__)
+
 
 def get_toolkit_by_id(toolkit_id: str):
     for toolkit in toolkits:
@@ -23,6 +26,7 @@ def fetch_and_run_tool(
     config: dict = None,
     toolkit_id: str | uuid.UUID | None = None,
     db_id: str | uuid.UUID | None = None,
+    run_store: BaseRunStore = None,
 ):
     tool = get_tool_by_name(tool_id)
     config = config or {}
@@ -34,13 +38,15 @@ def fetch_and_run_tool(
             config = tool.config
         else:
             raise ValueError(f"Tool with id {tool_id} not found")
+    run_store = run_store or InMemoryRunStore()
     result = None
-    with tool_run_context(tool_id, config, input_data, toolkit_id) as (run, context):
+    with tool_run_context(
+        tool_id, config, input_data, toolkit_id, run_store=run_store
+    ) as (run, context):
         result = tool.run(input_data)
 
         # Update run with result
         run.data["outputs"] = to_serializable(result)
-        run.save()
 
     return result
 
@@ -63,22 +69,22 @@ def fetch_and_run_toolkit_tool(
     if not tool or not tool.run or not tool.fn:
         raise ValueError(f"Tool with id {tool_id} not found or is invalid")
     result = {"run_id": None, "result": None}
-    print(f"Running tool {tool_id} with input {input_data}")
-    with tool_run_context(tool_id, config, input_data, toolkit_id=toolkit_id) as (
-        run,
-        context,
-    ):
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Running tool {tool_id} with input {input_data}")
+    with tool_run_context(
+        tool_id, config, input_data, toolkit_id=toolkit_id, run_store=run_store
+    ) as (run, context):
         args = (
             input_data.model_dump() if isinstance(input_data, BaseModel) else input_data
         )
         tool_call = ToolCall(
-            name=tool.name, arguments=args, id=f"app-tool-call-{str(uuid.uuid4())[:24]}"
+            name=tool.name, args=args, id=f"app-tool-call-{str(uuid.uuid4())[:24]}"
         )
         result["run_id"] = run.id
         tool_result = handle_tool_call(tool_call, [tool])
-        print(f"Tool result**: {tool_result} {tool_result.result}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Tool result: {tool_result} {tool_result.result}")
         result["result"] = tool_result.result
         run.data["outputs"] = to_serializable(tool_result)
-        run_store.save_run(run)
 
     return result
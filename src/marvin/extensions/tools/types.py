@@ -1,12 +1,44 @@
+import functools
 import json
 from abc import abstractmethod
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Type
 
-from pydantic import BaseModel, Field
-from pydantic.dataclasses import dataclass
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+# parameters used for tools without an fn_schema; shared, treat as read-only
+_DEFAULT_PARAMS = {
+    "type": "object",
+    "properties": {
+        "input": {"title": "input query string", "type": "string"},
+    },
+    "required": ["input"],
+}
+
+
+_WANTED_SCHEMA_KEYS = ("type", "properties", "required", "definitions")
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_parameters(fn_schema: Type[BaseModel]) -> dict:
+    parameters = fn_schema.schema()
+    return {k: parameters[k] for k in _WANTED_SCHEMA_KEYS if k in parameters}
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_parameters_json(fn_schema: Type[BaseModel]) -> bytes:
+    parameters = _schema_parameters(fn_schema)
+    if orjson is not None:
+        return orjson.dumps(parameters)
+    return json.dumps(parameters).encode()
+
+
+@dataclass(slots=True, frozen=True)
 class ToolMetadata:
     description: str
     name: Optional[str] = None
@@ -18,45 +50,44 @@ class ToolMetadata:
     is_live: bool | None = None
     return_direct: bool | None = None
     spec_name: Optional[str] = None
-    tool_hash: Optional[str] = Field(
-        default=None, description="Unique Hash of the tool"
-    )
-    variables: Optional[List[str | dict] | dict] = Field(
-        default={}, description="Variables to be used in the tool"
-    )
-    required_variables: Optional[List[dict]] = Field(
-        default=[], description="Required variables to be used in the tool"
-    )
+    # unique hash of the tool
+    tool_hash: Optional[str] = None
+    # variables to be used in the tool
+    variables: Optional[List[str | dict] | dict] = field(default_factory=dict)
+    # required variables to be used in the tool
+    required_variables: Optional[List[dict]] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ToolMetadata":
+        """Validate untrusted input, e.g. tool metadata loaded from json."""
+        return _tool_metadata_adapter().validate_python(data)
 
     @property
     def _tool_id(self) -> str:
         return self.tool_id or self.name
 
     def get_parameters_dict(self) -> dict:
+        """
+        Get the parameters schema. Cached per fn_schema class, so the returned
+        dict is shared and must not be mutated.
+        """
         if self.fn_schema is None:
-            parameters = {
-                "type": "object",
-                "properties": {
-                    "input": {"title": "input query string", "type": "string"},
-                },
-                "required": ["input"],
-            }
-        else:
-            parameters = self.fn_schema.schema()
-            parameters = {
-                k: v
-                for k, v in parameters.items()
-                if k in ["type", "properties", "required", "definitions"]
-            }
-        return parameters
+            return _DEFAULT_PARAMS
+        return _schema_parameters(self.fn_schema)
 
     @property
     def fn_schema_str(self) -> str:
         """Get fn schema as string."""
         if self.fn_schema is None:
             raise ValueError("fn_schema is None.")
-        parameters = self.get_parameters_dict()
-        return json.dumps(parameters)
+        return self.fn_schema_bytes.decode()
+
+    @property
+    def fn_schema_bytes(self) -> bytes:
+        """Get fn schema as encoded json, e.g. for http responses."""
+        if self.fn_schema is None:
+            raise ValueError("fn_schema is None.")
+        return _schema_parameters_json(self.fn_schema)
 
     def get_name(self) -> str:
         """Get name."""
@@ -76,9 +107,16 @@ class ToolMetadata:
         }
 
 
+@functools.lru_cache(maxsize=None)
+def _tool_metadata_adapter() -> TypeAdapter:
+    return TypeAdapter(ToolMetadata)
+
+
 class ToolOutput(BaseModel):
     """Tool output."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     content: str
     tool_name: str
     raw_input: Dict[str, Any]
@@ -148,6 +186,8 @@ class BaseToolAsyncAdapter(AsyncBaseTool):
 class SpecDefinition(BaseModel):
     """Spec Definition."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     name: str
     description: str
     context_variables: List[str | dict]
@@ -1,68 +1,89 @@
-from .document import Document
-from .tools import (
-    ToolCall,
-    ToolResponse,
-    ToolSelection,
-    AppToolCall,
-    AppFunction,
-    AnyToolCall,
-    AppCodeInterpreterTool,
-    AppFileSearchTool,
-)
-from .message import (
-    ChatMessage,
-    MessageRole,
-    ImageFileContentBlock,
-    TextContentBlock,
-    FileMessageContent,
-    ImageMessageContent,
-    Metadata,
-    Function,
-    FunctionToolCall,
-)
-from .chat_response import ChatResponse
-from .llms import AIModels
-from .events import (
-    StreamChatMessageEvent,
-)
-from .thread import ChatThread
-from .start_run import TriggerAgentRun
-from .run import PersistedRun
-from .agent import AgentConfig, RuntimeConfig, AgentApiTool
-from .chat_response import CompletionResponse
-from .data_source import DataSourceFileUpload, DataSource, VectorStore
+"""
+Types are imported lazily on first attribute access (PEP 562), so importing
+one type does not build the pydantic schemas of every other module here.
+"""
 
-__all__ = [
-    "Document",
-    "StreamChatMessageEvent",
-    "AgentApiTool",
-    "AppToolCall",
-    "ChatThread",
-    "AppCodeInterpreterTool",
-    "AppFileSearchTool",
-    "AnyToolCall",
-    "AppFunction",
-    "ToolCall",
-    "ToolResponse",
-    "ToolSelection",
-    "Metadata",
-    "ChatMessage",
-    "FileMessageContent",
-    "ImageMessageContent",
-    "AgentConfig",
-    "ImageFileContentBlock",
-    "TextContentBlock",
-    "MessageRole",
-    "ChatResponse",
-    "CompletionResponse",
-    "AIModels",
-    "Document",
-    "ChatThread",
-    "RuntimeConfig",
-    "Function",
-    "FunctionToolCall",
-    "PersistedRun",
-    "TriggerAgentRun",
-    "DataSourceSourceFileUpload",
-    "DataSource",
-]
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .document import Document
+    from .tools import (
+        ToolCall,
+        ToolResponse,
+        ToolSelection,
+        AppToolCall,
+        AppFunction,
+        AnyToolCall,
+        AppCodeInterpreterTool,
+        AppFileSearchTool,
+    )
+    from .message import (
+        ChatMessage,
+        MessageRole,
+        ImageFileContentBlock,
+        TextContentBlock,
+        FileMessageContent,
+        ImageMessageContent,
+        Metadata,
+        Function,
+        FunctionToolCall,
+    )
+    from .chat_response import ChatResponse, CompletionResponse
+    from .llms import AIModels
+    from .events import StreamChatMessageEvent
+    from .thread import ChatThread
+    from .start_run import TriggerAgentRun
+    from .run import PersistedRun
+    from .agent import AgentConfig, RuntimeConfig, AgentApiTool
+    from .data_source import DataSourceFileUpload, DataSource, VectorStore
+
+_LAZY_IMPORTS = {
+    "Document": "document",
+    "ToolCall": "tools",
+    "ToolResponse": "tools",
+    "ToolSelection": "tools",
+    "AppToolCall": "tools",
+    "AppFunction": "tools",
+    "AnyToolCall": "tools",
+    "AppCodeInterpreterTool": "tools",
+    "AppFileSearchTool": "tools",
+    "ChatMessage": "message",
+    "MessageRole": "message",
+    "ImageFileContentBlock": "message",
+    "TextContentBlock": "message",
+    "FileMessageContent": "message",
+    "ImageMessageContent": "message",
+    "Metadata": "message",
+    "Function": "message",
+    "FunctionToolCall": "message",
+    "ChatResponse": "chat_response",
+    "CompletionResponse": "chat_response",
+    "AIModels": "llms",
+    "StreamChatMessageEvent": "events",
+    "ChatThread": "thread",
+    "TriggerAgentRun": "start_run",
+    "PersistedRun": "run",
+    "AgentConfig": "agent",
+    "RuntimeConfig": "agent",
+    "AgentApiTool": "agent",
+    "DataSourceFileUpload": "data_source",
+    "DataSource": "data_source",
+    "VectorStore": "data_source",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY_IMPORTS])
+
+
+__all__ = list(_LAZY_IMPORTS)
@@ -1,20 +1,74 @@
+import sys
 import uuid
-from typing import Callable, List, Literal, Optional, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, List, Literal, Optional, Union
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Discriminator,
+    Field,
+    PrivateAttr,
+    Tag,
+    TypeAdapter,
+    field_validator,
+    with_config,
+)
+from typing_extensions import Annotated, Required, TypedDict
 
 from marvin.extensions.agent_memory.memory import Memory
-from marvin.extensions.types.base import BaseModelConfig
+from marvin.extensions.types.base import BASE_CONFIG
 from marvin.extensions.types.llms import AIModels
 from marvin.extensions.utilities.render_prompt import (
     render_assistant_instructions,
     render_instructions,
 )
-from marvin.tools.assistants import AssistantTool
+
+if TYPE_CHECKING:
+    from marvin.tools.assistants import AssistantTool
 
 OPENAI_TOOLS = ["code_interpreter", "file_search"]
 
+_INSTRUCTION_RENDERERS = {"assistant": render_assistant_instructions}
+
+
+DEFAULT_AGENT_INSTRUCTIONS = "You are a helpful assistant."
+
+_DEFAULT_STARTERS = (
+    {
+        "value": "Search google for AI tools",
+        "title": "Search google for AI tools",
+    },
+    {
+        "value": "What is vanty.ai",
+        "title": "What is vanty.ai",
+    },
+)
+
+
+def _default_instructions_doc(text: str) -> dict:
+    return {
+        "type": "doc",
+        "content": [
+            {"type": "paragraph", "content": [{"type": "text", "text": text}]},
+        ],
+    }
+
+
+@lru_cache(maxsize=None)
+def _default_toolkit_ids() -> tuple[str, ...]:
+    from marvin.extensions.tools.app_tools import web_browser_toolkit
+
+    return (web_browser_toolkit.id,)
+
+
+_INTERNED_TOOL_FIELDS = ("name", "tool_id", "custom_name")
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
 
 class AgentApiTool(BaseModel):
     """
@@ -36,43 +90,111 @@ class AgentApiTool(BaseModel):
     auto_run: bool | None = True
     tool_id: str | None = None
 
-    class Config(BaseModelConfig):
-        pass
+    model_config = BASE_CONFIG
+
+    @field_validator("name", "tool_id", "custom_name", mode="after")
+    @classmethod
+    def _intern_names(cls, v):
+        # tool names repeat across agents and are used as lookup keys
+        return _intern(v)
 
     @classmethod
     def from_tool(cls, tool, config: dict = None):
-        dict_tool = tool.model_dump()
-        dict_tool["fn"] = None
-        dict_tool["tool_id"] = tool.db_id if tool.db_id else tool.name
-        if config:
-            dict_tool["config"] = config
-        else:
-            dict_tool["config"] = {}
-        return cls(**dict_tool)
+        """
+        Copy the fields of an already validated tool without a
+        `model_dump` / re-validation round trip.
+        """
+        values = {k: getattr(tool, k, f.default) for k, f in cls.model_fields.items()}
+        values["fn"] = None
+        values["tool_id"] = tool.db_id or tool.name
+        values["config"] = config or {}
+        for k in _INTERNED_TOOL_FIELDS:
+            values[k] = _intern(values[k])
+        return cls.model_construct(**values)
+
+
+@with_config(ConfigDict(extra="allow"))
+class TiptapNode(TypedDict, total=False):
+    type: Required[str]
+    content: Optional[List["TiptapAnyNode"]]
+    attrs: Optional[dict]
+    marks: Optional[List[dict]]
+    text: Optional[str]
+
+
+@with_config(ConfigDict(extra="allow"))
+class TiptapText(TypedDict, total=False):
+    type: Required[Literal["text"]]
+    text: Optional[str]
+    marks: Optional[List[dict]]
+
+
+@with_config(ConfigDict(extra="allow"))
+class TiptapParagraph(TypedDict, total=False):
+    type: Required[Literal["paragraph"]]
+    content: Optional[List["TiptapAnyNode"]]
+    attrs: Optional[dict]
 
 
-class TiptapNode(BaseModel):
-    type: str
-    content: Optional[List["TiptapNode"]] = None
-    attrs: Optional[dict] = None
-    marks: Optional[List[dict]] = None
-    text: Optional[str] = None
+@with_config(ConfigDict(extra="allow"))
+class TiptapHeading(TypedDict, total=False):
+    type: Required[Literal["heading"]]
+    content: Optional[List["TiptapAnyNode"]]
+    attrs: Optional[dict]
 
-    class Config:
-        extra = "allow"
 
+@with_config(ConfigDict(extra="allow"))
+class TiptapListItem(TypedDict, total=False):
+    type: Required[Literal["listItem"]]
+    content: Optional[List["TiptapAnyNode"]]
+    attrs: Optional[dict]
 
-class TiptapDoc(BaseModel):
-    type: Literal["doc"]
-    content: List[TiptapNode] | None = None
+
+_TIPTAP_NODE_TYPES = {"text", "paragraph", "heading", "listItem"}
+
+
+def _tiptap_node_tag(value) -> str:
+    node_type = value.get("type") if isinstance(value, dict) else None
+    return node_type if node_type in _TIPTAP_NODE_TYPES else "node"
+
+
+# known node kinds are dispatched on `type`, everything else is a generic node
+TiptapAnyNode = Annotated[
+    Union[
+        Annotated[TiptapText, Tag("text")],
+        Annotated[TiptapParagraph, Tag("paragraph")],
+        Annotated[TiptapHeading, Tag("heading")],
+        Annotated[TiptapListItem, Tag("listItem")],
+        Annotated[TiptapNode, Tag("node")],
+    ],
+    Discriminator(_tiptap_node_tag),
+]
+
+
+class TiptapDoc(TypedDict, total=False):
+    type: Required[Literal["doc"]]
+    content: Optional[List[TiptapAnyNode]]
+
+
+@lru_cache(maxsize=None)
+def _tiptap_doc_adapter() -> TypeAdapter:
+    return TypeAdapter(TiptapDoc)
 
 
 class AgentInstructions(BaseModel):
     text: str | None = None
-    json_doc: TiptapDoc | None = Field(default=None, alias="json")
+    # editor documents are passed through as-is, see `get_doc`
+    json_doc: dict | None = Field(default=None, alias="json")
+
+    model_config = BASE_CONFIG
 
-    class Config(BaseModelConfig):
-        pass
+    def get_doc(self) -> TiptapDoc | None:
+        """
+        Validate the tiptap document on demand.
+        """
+        if self.json_doc is None:
+            return None
+        return _tiptap_doc_adapter().validate_python(self.json_doc)
 
 
 class RuntimeConfig(BaseModel):
@@ -93,11 +215,12 @@ class RuntimeConfig(BaseModel):
         default=None, description="Extra runtime config for agents"
     )
 
-    class Config(BaseModelConfig):
-        pass
+    model_config = BASE_CONFIG
 
 
 class CustomToolkit(BaseModel):
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     toolkit_id: str
     db_id: str
 
@@ -158,41 +281,64 @@ class AgentConfig(BaseModel):
     # system
     is_internal: bool | None = False
 
-    class Config(BaseModelConfig):
-        pass
+    # cached (key, tools, config) per `is_assistant` flag
+    _tools_cache: dict = PrivateAttr(default_factory=dict)
+
+    model_config = BASE_CONFIG
+
+    def _tools_cache_key(self) -> tuple:
+        return (
+            tuple(self.builtin_toolkits),
+            tuple(ct.toolkit_id for ct in self.custom_toolkits),
+            str(self.tenant_id),
+        )
+
+    def _get_agent_tools(self, is_assistant=False) -> tuple[list, dict]:
+        """
+        Memoized `get_agent_tools`, recomputed when the toolkits change.
+        """
+        from marvin.extensions.tools.helpers import get_agent_tools
+
+        key = self._tools_cache_key()
+        cached = self._tools_cache.get(is_assistant)
+        if cached is None or cached[0] != key:
+            tools, config = get_agent_tools(self, is_assistant=is_assistant)
+            cached = self._tools_cache[is_assistant] = (key, tools, config)
+            self.toolkit_config = [config] if config else []
+        _, tools, config = cached
+        # callers get their own tool objects, the cached ones stay untouched
+        return [t.model_copy() for t in tools], config
 
     def construct_unique_name(self):
         short_id = str(self.id)[:4]
         return f"{self.name}-{short_id}"
 
-    def get_assistant_tools(self) -> List[Callable | AssistantTool]:
+    def get_assistant_tools(self) -> "List[Callable | AssistantTool]":
         """
         Fetch tools for *assistant running on openai*
         Returns a list of functions for assistant to use.
          - code interpreter & filesearch are not supported for other agents.
          - file search
         """
-        from marvin.extensions.tools.helpers import get_agent_tools  # noqa
         from marvin.beta.assistants import CodeInterpreter, FileSearch  # noqa
 
+        native_tools = {"file_search": FileSearch, "code_interpreter": CodeInterpreter}
         tools = []
-        agent_tools, config = get_agent_tools(self, is_assistant=True)
+        added = set()
+        agent_tools, _ = self._get_agent_tools(is_assistant=True)
         for t in agent_tools:
-            # native file search
-            if t.function.name == "file_search":
-                tools.append(FileSearch)
-            # native code interpreter if applicable
-            elif t.function.name == "code_interpreter":
-                tools.append(CodeInterpreter)
+            # native file search / code interpreter if applicable
+            name = t.function.name
+            if name in native_tools:
+                tools.append(native_tools[name])
+                added.add(name)
             else:
                 tools.append(t)
         # remote
-        if "code_interpreter" in self.builtin_toolkits and CodeInterpreter not in tools:
-            tools.append(CodeInterpreter)
-        if "file_search" in self.builtin_toolkits and FileSearch not in tools:
-            tools.append(FileSearch)
+        for name in ("code_interpreter", "file_search"):
+            if name in self.builtin_toolkits and name not in added:
+                tools.append(native_tools[name])
 
-        self.toolkit_config = [config] if config else []
         return tools
 
     def get_memories(self) -> List[Memory]:
@@ -206,10 +352,7 @@ class AgentConfig(BaseModel):
         Fetch agent tools for agents
         Returns a list of functions for agent to use.
         """
-        from marvin.extensions.tools.helpers import get_agent_tools
-
-        tools, config = get_agent_tools(self)
-        self.toolkit_config = [config] if config else []
+        tools, _ = self._get_agent_tools()
         return tools
 
     def agent_tools_to_function_tools(self) -> List[AgentApiTool]:
@@ -222,10 +365,8 @@ class AgentConfig(BaseModel):
     def get_instructions(self, simple=False):
         if simple:
             return self.instructions.text
-        if self.mode == "assistant":
-            return render_assistant_instructions(self)
-        else:
-            return render_instructions(self)
+        render = _INSTRUCTION_RENDERERS.get(self.mode, render_instructions)
+        return render(self)
 
     def as_assistant(self):
         from marvin.beta.local.assistant import LocalAssistant
@@ -240,42 +381,22 @@ class AgentConfig(BaseModel):
 
     @classmethod
     def default_agent(cls, model=None):
-        default_model = AIModels.GPT_4O_MINI
-        instructions = "You are a helpful assistant."
-        from marvin.extensions.tools.app_tools import web_browser_toolkit
-
+        instructions = AgentInstructions.model_construct(
+            text=DEFAULT_AGENT_INSTRUCTIONS,
+            json_doc=_default_instructions_doc(DEFAULT_AGENT_INSTRUCTIONS),
+        )
         return cls(
             name="Default Assistant",
-            model=model or default_model,
+            model=model or AIModels.GPT_4O_MINI,
             mode="assistant",
             description="Default agent",
-            system_prompt=instructions,
-            instructions={
-                "json": {
-                    "type": "doc",
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [{"type": "text", "text": instructions}],
-                        },
-                    ],
-                },
-                "text": "You are a helpful assistant.",
-            },
+            system_prompt=DEFAULT_AGENT_INSTRUCTIONS,
+            instructions=instructions,
             triggers=[],
             is_document=False,
             include_document=False,
             settings={},
             use_citations=True,
-            builtin_toolkits=[web_browser_toolkit.id],
-            starters=[
-                {
-                    "value": "Search google for AI tools",
-                    "title": "Search google for AI tools",
-                },
-                {
-                    "value": "What is vanty.ai",
-                    "title": "What is vanty.ai",
-                },
-            ],
+            builtin_toolkits=list(_default_toolkit_ids()),
+            starters=[dict(s) for s in _DEFAULT_STARTERS],
         )
@@ -1,10 +1,10 @@
-from pydantic import AnyHttpUrl
+from pydantic import AnyHttpUrl, ConfigDict
 
-
-class BaseModelConfig:
-    extra = "allow"
-    allow_mutation = False
-    arbitrary_types_allowed = True
+BASE_CONFIG = ConfigDict(
+    extra="allow",
+    arbitrary_types_allowed=True,
+    defer_build=True,
+)
 
 
 class CustomUrl(AnyHttpUrl):
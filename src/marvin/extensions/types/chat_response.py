@@ -1,8 +1,15 @@
 import uuid
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
-from openai.types.chat import ChatCompletion, ChatCompletionChunk
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+if TYPE_CHECKING:
+    from openai.types.chat import ChatCompletion, ChatCompletionChunk
+
+    ResponseMessage = ChatCompletion | ChatCompletionChunk | Any
+else:
+    # stored as-is, the openai models are only needed for type checking
+    ResponseMessage = Any
 
 
 class CompletionResponse(BaseModel):
@@ -30,7 +37,11 @@ class CompletionResponse(BaseModel):
 class ChatResponse(BaseModel):
     """Chat response."""
 
-    message: ChatCompletion | ChatCompletionChunk | Any
+    model_config = ConfigDict(
+        extra="allow", arbitrary_types_allowed=True, defer_build=True, frozen=True
+    )
+
+    message: ResponseMessage
     raw: Optional[dict] = None
     delta: Optional[str] = None
     metadata: dict | None = Field(default_factory=dict)
@@ -39,8 +50,3 @@ class ChatResponse(BaseModel):
 
     def __str__(self) -> str:
         return str(self.message)
-
-    class Config:
-        allow_extra = True
-        arbitrary_types_allowed = True
-        extra = "allow"
@@ -1,13 +1,24 @@
+import base64
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Literal, Optional
-
-from pydantic import BaseModel, Field, HttpUrl
+from typing import Annotated, Any, Dict, List, Literal, Optional
+
+from pydantic import (
+    Base64Encoder,
+    BaseModel,
+    ConfigDict,
+    EncodedBytes,
+    Field,
+    HttpUrl,
+    with_config,
+)
+from typing_extensions import TypedDict
 
 from marvin.extensions.utilities.unique_id import generate_id
 
 
-class Glob(BaseModel):
+# small structural shapes are TypedDicts, validated without a nested model
+class Glob(TypedDict):
     glob: str
 
 
@@ -15,7 +26,7 @@ class StartUrl(BaseModel):
     url: HttpUrl
 
 
-class ProxyConfiguration(BaseModel):
+class ProxyConfiguration(TypedDict):
     use_apify_proxy: bool
 
 
@@ -36,16 +47,28 @@ class WebSource(BaseModel):
     custom_data: Dict[str, Any] = {}
 
 
-class IndexData(BaseModel):
-    mime_type: Optional[str] = None
-    base64_string: Optional[str] = None
-    prompt: Optional[str] = None
+class _Base64(Base64Encoder):
+    """
+    Base64Encoder without the line breaks `base64.encodebytes` inserts every
+    76 characters, so payloads round-trip unchanged.
+    """
 
+    @classmethod
+    def encode(cls, value: bytes) -> bytes:
+        return base64.b64encode(value)
 
-class ReferenceMetadata(BaseModel):
-    file_id: str | None = None
-    detail: str | None = None
-    model_config = dict(extra="allow")
+
+class IndexData(TypedDict, total=False):
+    mime_type: Optional[str]
+    # decoded bytes in memory, base64 text on the wire
+    base64_string: Optional[Annotated[bytes, EncodedBytes(encoder=_Base64)]]
+    prompt: Optional[str]
+
+
+@with_config(ConfigDict(extra="allow"))
+class ReferenceMetadata(TypedDict, total=False):
+    file_id: str | None
+    detail: str | None
 
 
 class DataSourceFileUpload(BaseModel):
@@ -101,6 +124,9 @@ class ExternalFileReference(BaseModel):
     model_config = dict(extra="allow")
 
 
+UPLOAD_TYPES = ("file", "image", "url")
+
+
 class DataSource(BaseModel):
     id: Optional[str | uuid.UUID] = Field(default_factory=lambda: generate_id("ds"))
     name: Optional[str] = None
@@ -146,21 +172,31 @@ class DataSource(BaseModel):
     class Config:
         extra = "allow"
 
+    @classmethod
     def from_file_upload(cls, upload: DataSourceFileUpload):
         """
         Create a DataSource from a file upload.
         DataSource objects can store metadata about a file.
+        The upload is already validated, so the models are constructed
+        directly and file details are kept in `file_store_metadata`.
         """
-        return cls(
+        values = dict(
             name=upload.file_name,
             description=upload.file_name,
-            file_name=upload.file_name,
-            file_type=upload.file_type,
-            file_size=upload.file_size,
-            file_id=upload.file_id,
-            file_upload_url=upload.file_upload_url,
-            file_upload_type=upload.file_upload_type,
+            file_store_metadata=FileStoreMetadata.model_construct(
+                file_id=upload.file_id,
+                file_name=upload.file_name,
+                file_type=upload.file_type,
+                file_size=upload.file_size,
+                file_path=upload.file_path,
+                url=upload.file_upload_url,
+            ),
         )
+        if upload.file_id is not None:
+            values["file_id"] = upload.file_id
+        if upload.file_upload_type in UPLOAD_TYPES:
+            values["upload_type"] = upload.file_upload_type
+        return cls.model_construct(**values)
 
     def as_reference(self):
         return {
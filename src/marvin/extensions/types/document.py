@@ -1,10 +1,25 @@
 import uuid
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
-from .base import BaseModelConfig
+from .base import BASE_CONFIG
+
+
+@lru_cache(maxsize=None)
+def _get_splitter():
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+    return RecursiveCharacterTextSplitter(chunk_size=800, chunk_overlap=400)
+
+
+@lru_cache(maxsize=None)
+def _get_embedder():
+    from marvin.extensions.embeddings.openai import OpenAIEmbeddings
+
+    return OpenAIEmbeddings()
 
 
 class DocumentMetadata(BaseModel):
@@ -14,8 +29,7 @@ class DocumentMetadata(BaseModel):
     document_id: str | None = None
     title: str | None = None
 
-    class Config(BaseModelConfig):
-        extra = "allow"
+    model_config = BASE_CONFIG
 
 
 class Document(BaseModel):
@@ -34,16 +48,27 @@ class Document(BaseModel):
     embeddings: List[float] | None = None
     search_type: Literal["kw", "vector"] = "vector"
 
-    class Config(BaseModelConfig):
-        pass
+    # (key, text) for llm_text_result, keyed on the fields it is built from
+    _llm_text: tuple | None = PrivateAttr(None)
+
+    model_config = BASE_CONFIG
 
     @staticmethod
-    def llm_text_result(instance):
+    def _format_llm_text(instance) -> str:
         return f"""
          #Document ID: {instance.id}
          #Page Content: {instance.page_content}
         """
 
+    @staticmethod
+    def llm_text_result(instance):
+        if not isinstance(instance, Document):
+            return Document._format_llm_text(instance)
+        key = (instance.id, instance.page_content)
+        if instance._llm_text is None or instance._llm_text[0] != key:
+            instance._llm_text = (key, Document._format_llm_text(instance))
+        return instance._llm_text[1]
+
     @staticmethod
     def llm_text_from_list(results):
         return "\n".join([Document.llm_text_result(i) for i in results])
@@ -53,29 +78,21 @@ class Document(BaseModel):
         """
         Vectorizable the chunks of the documents.
         """
-        from langchain_text_splitters import (
-            RecursiveCharacterTextSplitter,
-        )
-
         if isinstance(documents, str):
             documents = [Document(page_content=documents)]
 
         texts = [d.page_content for d in documents]
         metadata = [d.metadata for d in documents]
-        splitter = RecursiveCharacterTextSplitter(chunk_size=800, chunk_overlap=400)
-        return splitter.create_documents(texts, metadata)
+        return _get_splitter().create_documents(texts, metadata)
 
     @classmethod
     def get_embeddings(cls, documents):
         """
         Embed the chunks of the documents.
         """
-        from marvin.extensions.embeddings.openai import OpenAIEmbeddings
-
-        embedder = OpenAIEmbeddings()
-        embeddings = embedder.embed_documents(documents)
-        for idx, document in enumerate(documents):
-            document.embeddings = embeddings[idx]
+        embeddings = _get_embedder().embed_documents(documents)
+        for document, vector in zip(documents, embeddings, strict=True):
+            document.embeddings = vector
 
         return documents
 
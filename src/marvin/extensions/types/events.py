@@ -1,35 +1,27 @@
 from datetime import datetime
-from typing import Any, Dict
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
-from marvin.extensions.types.base import BaseModelConfig
 from marvin.extensions.types.message import ChatMessage
 
 
 class BaseEvent(BaseModel):
-    timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(), alias="timestamp"
-    )
+    timestamp: datetime = Field(default_factory=datetime.now, alias="timestamp")
     id_: str = Field(default_factory=lambda: str(uuid4()), description="Event ID")
-    span_id: str = Field(default_factory=str, description="Span ID")
+    span_id: str = Field(default="", description="Span ID")
     merge_id: str = Field(default_factory=lambda: str(uuid4()), description="Merge ID")
     parent_id: str | None = Field(None, description="Parent Event ID")
 
-    class Config:
-        arbitrary_types_allowed = True
-        defer_build = False
+    # events are built once per streamed frame and never mutated; stored runs
+    # may carry keys from older payloads, so unknown keys are dropped
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True, extra="ignore")
 
-    @classmethod
-    def class_name(cls):
+    @computed_field
+    @property
+    def class_name(self) -> str:
         """Return class name."""
-        return "BaseEvent"
-
-    def dict(self, **kwargs: Any) -> Dict[str, Any]:
-        data = super().model_dump(**kwargs)
-        data["class_name"] = self.class_name()
-        return data
+        return type(self).__name__
 
 
 class StreamChatMessageEvent(BaseEvent):
@@ -49,5 +41,4 @@ class StreamChatMessageEvent(BaseEvent):
     streaming: bool | None = Field(default=None, description="Streaming")
     type: str | None = Field(default=None, description="Type")
 
-    class Config(BaseModelConfig):
-        pass
+    model_config = ConfigDict(defer_build=True)
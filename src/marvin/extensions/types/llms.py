@@ -14,21 +14,18 @@ class AIModels(str, Enum):
 
     @staticmethod
     def provider(model: str):
-        if model in [
-            AIModels.CLAUDE_3_OPUS,
-            AIModels.CLAUDE_3_HAIKU,
-            AIModels.CLAUDE_3_5_SONNET,
-            AIModels.CLAUDE_3_SONNET,
-        ]:
-            return "anthropic"
+        # str enum members hash like their values, so plain strings match too
+        return _PROVIDER_BY_MODEL.get(model, "openai")
 
-        if model in [AIModels.GEMINI_FLASH]:
-            return "google"
 
-        if model in [AIModels.GPT_4O_MINI, AIModels.GPT_4O]:
-            return "openai"
-
-        if model in [AIModels.COMMAND_PLUS, AIModels.COMMAND_PLUS_R]:
-            return "cohere"
-
-        return "openai"
+_PROVIDER_BY_MODEL = {
+    AIModels.CLAUDE_3_OPUS: "anthropic",
+    AIModels.CLAUDE_3_HAIKU: "anthropic",
+    AIModels.CLAUDE_3_5_SONNET: "anthropic",
+    AIModels.CLAUDE_3_SONNET: "anthropic",
+    AIModels.GEMINI_FLASH: "google",
+    AIModels.GPT_4O_MINI: "openai",
+    AIModels.GPT_4O: "openai",
+    AIModels.COMMAND_PLUS: "cohere",
+    AIModels.COMMAND_PLUS_R: "cohere",
+}
@@ -1,10 +1,9 @@
 import uuid
 from datetime import datetime
 from enum import Enum
-from typing import Any, List, Literal, Optional, Union
+from typing import Annotated, Any, List, Literal, Optional, Union
 from uuid import UUID
 
-import humps
 from openai.types.beta.threads.message_content import (
     ImageFileContentBlock,
     TextContentBlock,
@@ -20,9 +19,9 @@ from openai.types.beta.threads.runs.function_tool_call import (
 from openai.types.beta.threads.runs.function_tool_call import (
     FunctionToolCall as OpenAIFunctionToolCall,
 )
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag
 
-from marvin.extensions.types.base import BaseModelConfig
+from marvin.extensions.types.base import BASE_CONFIG
 from marvin.extensions.types.tools import (
     AppCodeInterpreterTool,
     AppFileSearchTool,
@@ -61,8 +60,7 @@ class FileMessageContent(BaseModel):
     file_id: Optional[str] = None
     metadata: Optional[DataSource] = None
 
-    class Config(BaseModelConfig):
-        pass
+    model_config = BASE_CONFIG
 
 
 class ImageMessageContent(BaseModel):
@@ -74,11 +72,28 @@ class ImageMessageContent(BaseModel):
     file_id: Optional[str] = None
     metadata: Optional[DataSource] = None
 
-    class Config(BaseModelConfig):
-        pass
+    model_config = BASE_CONFIG
 
 
-AttachmentItem = Union[ImageMessageContent, FileMessageContent]
+AttachmentItem = Annotated[
+    Union[ImageMessageContent, FileMessageContent], Field(discriminator="type")
+]
+
+
+def _tool_call_tag(value) -> str | None:
+    if isinstance(value, dict):
+        return value.get("type")
+    return getattr(value, "type", None)
+
+
+AppToolCallItem = Annotated[
+    Union[
+        Annotated[AppToolCall, Tag("function")],
+        Annotated[AppCodeInterpreterTool, Tag("code_interpreter")],
+        Annotated[AppFileSearchTool, Tag("file_search")],
+    ],
+    Discriminator(_tool_call_tag),
+]
 
 
 class Metadata(BaseModel):
@@ -89,32 +104,54 @@ class Metadata(BaseModel):
     """
 
     streaming: bool = False
-    run_id: str | UUID | None = None
+    run_id: str | UUID | None = Field(default=None, alias="runId")
     id: str | UUID | None = None
-    tool_calls: (
-        List[Union[AppToolCall, AppCodeInterpreterTool, AppFileSearchTool]] | None | Any
-    ) = None
-    raw_tool_output: Any | None = None
+    # app tool calls when every item is recognised, otherwise kept as given
+    tool_calls: List[AppToolCallItem] | None | Any = Field(
+        default=None, alias="toolCalls"
+    )
+    # raw output of the tool, stored unvalidated
+    raw_tool_output: Any = Field(default=None, alias="rawToolOutput")
     name: str | None = None
     type: str | None = "message"
     attachments: List[AttachmentItem] | None = None
     created: datetime = Field(default_factory=datetime.now)
 
-    class Config:
-        arbitrary_types_allowed = True
-        extra = "allow"
-        alias_generator = humps.camelize
-        populate_by_name = True
-
-
-MessageContentType = Union[
-    ImageMessageContent,  # attachment
-    FileMessageContent,  # attachment
-    TextContentBlock,  # openai
-    ImageFileDeltaBlock,  # openai delta
-    ImageFileContentBlock,  # openai
-    TextDeltaBlock,  # openai delta
-    ImageURLDeltaBlock,  # openai delta
+    # camelCase aliases are declared on the fields above
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        extra="allow",
+        populate_by_name=True,
+        defer_build=True,
+    )
+
+
+def _content_tag(value) -> str | None:
+    """
+    Content blocks are tagged by `type`, openai delta blocks share their
+    type with the full blocks and are told apart by their `index`.
+    """
+    if isinstance(value, dict):
+        content_type, is_delta = value.get("type"), "index" in value
+    else:
+        content_type = getattr(value, "type", None)
+        is_delta = getattr(value, "index", None) is not None
+    if content_type is None:
+        return None
+    return f"{content_type}_delta" if is_delta else content_type
+
+
+MessageContentType = Annotated[
+    Union[
+        Annotated[ImageMessageContent, Tag("image")],  # attachment
+        Annotated[FileMessageContent, Tag("file")],  # attachment
+        Annotated[TextContentBlock, Tag("text")],  # openai
+        Annotated[ImageFileDeltaBlock, Tag("image_file_delta")],  # openai delta
+        Annotated[ImageFileContentBlock, Tag("image_file")],  # openai
+        Annotated[TextDeltaBlock, Tag("text_delta")],  # openai delta
+        Annotated[ImageURLDeltaBlock, Tag("image_url_delta")],  # openai delta
+    ],
+    Discriminator(_content_tag),
 ]
 
 
@@ -133,27 +170,13 @@ class ChatMessage(BaseModel):
     """
 
     role: MessageRole = MessageRole.USER
-    content: (
-        List[
-            Union[
-                ImageMessageContent,
-                FileMessageContent,
-                TextContentBlock,
-                ImageFileDeltaBlock,  # openai delta
-                ImageFileContentBlock,  # openai
-                TextDeltaBlock,  # openai delta
-                ImageURLDeltaBlock,  # openai delta
-            ]
-        ]
-        | None
-    ) = None
+    content: List[MessageContentType] | None = None
     id: str | UUID = Field(default_factory=uuid.uuid4)
     run_id: str | UUID | None = None
     thread_id: str | UUID | None = None
-    metadata: Metadata = Metadata()
+    metadata: Metadata = Field(default_factory=Metadata)
 
-    class Config(BaseModelConfig):
-        pass
+    model_config = BASE_CONFIG
 
     def __str__(self) -> str:
         return f"{self.role.value}: {self.content}"
@@ -1,6 +1,9 @@
 from typing import List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# schemas are compiled on first use rather than at import
+_RAG_CONFIG = ConfigDict(defer_build=True)
 
 
 class Citation(BaseModel):
@@ -18,6 +21,8 @@ class Citation(BaseModel):
         default_factory=list,
     )
 
+    model_config = _RAG_CONFIG
+
 
 class RagDocument(BaseModel):
     id: str | None = Field(
@@ -29,6 +34,8 @@ class RagDocument(BaseModel):
     title: str | None = Field(description="The title of the document", default=None)
     rag_id: str | None = Field(description="The RAG ID of the document", default=None)
 
+    model_config = _RAG_CONFIG
+
 
 class TextWithCitations(BaseModel):
     text: str = Field(description="The main text content", default="")
@@ -39,10 +46,14 @@ class TextWithCitations(BaseModel):
         description="A list of referenced documents", default_factory=list
     )
 
+    model_config = _RAG_CONFIG
+
 
 class SearchQueryText(BaseModel):
     text: str = Field(..., description="The search query text")
 
+    model_config = _RAG_CONFIG
+
 
 class SearchQuery(BaseModel):
     search_queries: List[SearchQueryText] = Field(
@@ -52,3 +63,5 @@ class SearchQuery(BaseModel):
         description="Whether the search queries are only used for searching",
         default=False,
     )
+
+    model_config = _RAG_CONFIG
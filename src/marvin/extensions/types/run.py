@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, List, Literal, Union
 from uuid import UUID
 
@@ -9,13 +10,13 @@ from openai.types.beta.threads.runs import (
     ToolCallsStepDetails,
 )
 from openai.types.beta.threads.runs.message_creation_step_details import MessageCreation
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
-from marvin.extensions.types.base import BaseModelConfig
+from marvin.extensions.types.base import BASE_CONFIG
 
 from .costs import TokenCreditsUsage
 from .events import StreamChatMessageEvent
-from .message import ChatMessage
+from .message import ChatMessage, MessageContentType, MessageRole, Metadata
 from .tools import AnyToolCall
 
 
@@ -25,48 +26,124 @@ class RunMetadata(BaseModel):
     messages: List[ChatMessage] | None = None
     message_ids: List[str] | None = None
 
-    class Config(BaseModelConfig):
-        extra = "allow"
+    # only the keys above are ever read back, so unknown ones are dropped
+    model_config = ConfigDict(BASE_CONFIG, extra="ignore")
 
 
 class AppMessageCreationStepDetails(MessageCreationStepDetails):
     type: Literal["message_creation"] = "message_creation"
     message_creation: MessageCreation
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class AppToolCallsStepDetails(ToolCallsStepDetails):
     tool_calls: List[AnyToolCall] | None = None
     type: Literal["tool_calls"] = "tool_calls"
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class AppRunStep(RunStep):
     step_details: Union[AppMessageCreationStepDetails, AppToolCallsStepDetails]
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class OpenaiRun(OpenaiRun):
-    class Config(BaseModelConfig):
-        extra = "allow"
+    model_config = BASE_CONFIG
+
+
+@lru_cache(maxsize=None)
+def _run_steps_adapter() -> TypeAdapter:
+    return TypeAdapter(List[AppRunStep])
+
+
+def validate_steps(steps: list) -> List[AppRunStep]:
+    """Validate serialized run steps received from outside the process."""
+    return _run_steps_adapter().validate_python(steps)
+
+
+@lru_cache(maxsize=None)
+def _message_content_adapter() -> TypeAdapter:
+    return TypeAdapter(List[MessageContentType])
+
+
+def _as_datetime(value):
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _construct_message(data: dict | ChatMessage | None) -> ChatMessage | None:
+    """
+    Build a chat message from its serialized form without validating it.
+    Content blocks are a tagged union and are still validated.
+    """
+    if not isinstance(data, dict):
+        return data
+    message = dict(data)
+    if isinstance(message.get("role"), str):
+        message["role"] = MessageRole(message["role"])
+    if message.get("content") is not None:
+        message["content"] = _message_content_adapter().validate_python(
+            message["content"]
+        )
+    if isinstance(message.get("metadata"), dict):
+        metadata = dict(message["metadata"])
+        if "created" in metadata:
+            metadata["created"] = _as_datetime(metadata["created"])
+        message["metadata"] = Metadata.model_construct(**metadata)
+    return ChatMessage.model_construct(**message)
+
+
+def _construct_event(data: dict | StreamChatMessageEvent) -> StreamChatMessageEvent:
+    """Build a stream event from its serialized form without validating it."""
+    if not isinstance(data, dict):
+        return data
+    event = dict(data)
+    if "timestamp" in event:
+        event["timestamp"] = _as_datetime(event["timestamp"])
+    event["message"] = _construct_message(event.get("message"))
+    return StreamChatMessageEvent.model_construct(**event)
+
+
+def _construct_run_metadata(metadata: dict) -> RunMetadata:
+    """Build run metadata serialized by this process without validating it."""
+    metadata = dict(metadata or {})
+    if isinstance(metadata.get("credits"), dict):
+        metadata["credits"] = TokenCreditsUsage.model_construct(**metadata["credits"])
+    if metadata.get("events") is not None:
+        metadata["events"] = [_construct_event(e) for e in metadata["events"]]
+    if metadata.get("messages") is not None:
+        metadata["messages"] = [_construct_message(m) for m in metadata["messages"]]
+    if metadata.get("message_ids") is not None:
+        metadata["message_ids"] = list(metadata["message_ids"])
+    return RunMetadata.model_construct(
+        **{k: v for k, v in metadata.items() if k in RunMetadata.model_fields}
+    )
 
 
 class PersistedRun(BaseModel):
     id: str | UUID | None = None
     thread_id: str | UUID | None = None
     tenant_id: str | UUID | None = None
-    created: datetime | str | None = None
-    modified: datetime | str | None = None
+    created: datetime | None = None
+    modified: datetime | None = None
     run: OpenaiRun | None = None
-    steps: List[AppRunStep] | None = []
-    metadata: dict | RunMetadata | None = RunMetadata()
+    steps: List[AppRunStep] | None = Field(default_factory=list)
+    metadata: dict | RunMetadata | None = Field(default_factory=RunMetadata)
     data: dict | None = None
     status: Any | None = None
 
-    class Config(BaseModelConfig):
-        extra = "allow"
+    model_config = BASE_CONFIG
 
-    def save_run_context_data(self, context):
+    def save_run_context_data(self, context, trusted: bool = True):
         """
         Update the run with the data from the context.
         Existing data will be overwritten.
+
+        Run metadata (events, messages, credits) and steps built by this
+        process are stored as serialized without re-validating them; pass
+        `trusted=False` when the context data comes from outside.
         """
         storage = context.cache
         run_metadata = storage.run_metadata
@@ -76,11 +153,16 @@ class PersistedRun(BaseModel):
 
         if openai_run:
             metadata = openai_run.get("metadata", {})
-            openai_run["tools"] = openai_run.get("tools", None) or []
-            self.run = OpenaiRun.model_validate(openai_run)
-            self.metadata = RunMetadata.model_validate(metadata)
+            # the context dict may be shared, so it is copied rather than patched
+            self.run = OpenaiRun.model_validate(
+                {**openai_run, "tools": openai_run.get("tools") or []}
+            )
+            if trusted:
+                self.metadata = _construct_run_metadata(metadata)
+            else:
+                self.metadata = RunMetadata.model_validate(metadata)
 
         steps = run_metadata.get("steps", [])
-        self.steps = steps
+        self.steps = steps if trusted else validate_steps(steps)
 
         return self
@@ -1,12 +1,31 @@
+import os
 import uuid
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# random bytes for thread ids are read in batches, one urandom call per
+# _UUID_BATCH threads instead of one per thread
+_UUID_BATCH = 256
+_uuid_pool: List[uuid.UUID] = []
+# a forked child must not hand out the ids its parent already has queued
+os.register_at_fork(after_in_child=_uuid_pool.clear)
+
+
+def _next_uuid() -> uuid.UUID:
+    try:
+        return _uuid_pool.pop()
+    except IndexError:
+        raw = os.urandom(16 * _UUID_BATCH)
+        _uuid_pool.extend(
+            uuid.UUID(bytes=raw[i : i + 16], version=4) for i in range(16, len(raw), 16)
+        )
+        return uuid.UUID(bytes=raw[:16], version=4)
 
 
 class ChatThread(BaseModel):
-    id: str | uuid.UUID | None = Field(default_factory=uuid.uuid4)
+    id: str | uuid.UUID | None = Field(default_factory=_next_uuid)
     name: Optional[str] = None
     tenant_id: Optional[str | uuid.UUID | int] = None
     created: datetime = Field(default_factory=datetime.now)
@@ -19,3 +38,5 @@ class ChatThread(BaseModel):
     files: List[str] = Field(
         default_factory=list, description="List of data source ids."
     )
+
+    model_config = ConfigDict(defer_build=True)
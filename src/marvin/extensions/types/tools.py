@@ -1,19 +1,22 @@
-from typing import Any, Dict, Union
+from functools import lru_cache
+from typing import Any, Dict, List, Union
 
-from openai._utils import PropertyInfo
 from openai.types.beta.threads.runs import (
     CodeInterpreterToolCall as OpenAICodeInterpreterToolCall,
 )
 from openai.types.beta.threads.runs import (
     FileSearchToolCall as OpenAIFileSearchToolCall,
 )
+from openai.types.beta.threads.runs.code_interpreter_tool_call import (
+    CodeInterpreterOutput,
+)
 from openai.types.beta.threads.runs.function_tool_call import (
     Function as OpenAIFunction,
 )
 from openai.types.beta.threads.runs.function_tool_call import (
     FunctionToolCall as OpenAIFunctionToolCall,
 )
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing_extensions import Annotated, TypeAlias
 
 
@@ -24,14 +27,15 @@ class ToolResponse(BaseModel):
     tool_call_id: str | None = None
     raw_response: Any | None = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class ToolCall(BaseModel):
     arguments: Dict[str, Any] | None
     id: str | None
     name: str | None
 
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
 
 class ToolSelection(BaseModel):
@@ -41,25 +45,30 @@ class ToolSelection(BaseModel):
     tool_name: str = Field(description="Tool name to select.")
     tool_kwargs: Dict[str, Any] = Field(description="Keyword arguments for the tool.")
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class AppFunction(OpenAIFunction):
     """Function with structured output."""
 
-    structured_output: Any | None = Field(
-        description="Structured output of the tool.", default=None
-    )
+    structured_output: Any | None = None
+
+
+@lru_cache(maxsize=None)
+def _code_interpreter_outputs_adapter() -> TypeAdapter:
+    return TypeAdapter(List[CodeInterpreterOutput])
 
 
 class AppCodeInterpreterTool(OpenAICodeInterpreterToolCall):
     """Code interpreter tool with structured output."""
 
-    structured_output: Any | None = Field(
-        description="Structured output of the tool.", default=None
-    )
+    structured_output: Any | None = None
 
     @classmethod
     def dump(cls, tool: OpenAICodeInterpreterToolCall):
-        c = [c.model_dump() for c in tool.code_interpreter.outputs]
+        c = _code_interpreter_outputs_adapter().dump_python(
+            tool.code_interpreter.outputs
+        )
         return {
             "type": "code_interpreter",
             "code_interpreter": {
@@ -73,9 +82,7 @@ class AppCodeInterpreterTool(OpenAICodeInterpreterToolCall):
 class AppFileSearchTool(OpenAIFileSearchToolCall):
     """File search tool with structured output."""
 
-    structured_output: Any | None = Field(
-        description="Structured output of the tool.", default=None
-    )
+    structured_output: Any | None = None
 
 
 class AppToolCall(OpenAIFunctionToolCall):
@@ -86,5 +93,5 @@ class AppToolCall(OpenAIFunctionToolCall):
 
 AnyToolCall: TypeAlias = Annotated[
     Union[AppToolCall, AppCodeInterpreterTool, AppFileSearchTool],
-    PropertyInfo(discriminator="type"),
+    Field(discriminator="type"),
 ]
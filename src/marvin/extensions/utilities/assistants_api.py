@@ -1,49 +1,55 @@
+import atexit
 import os
-import tempfile
+from functools import lru_cache
 from typing import IO
 
 from openai import AsyncOpenAI, OpenAI
 from openai.types import FileObject
+from pydantic import SecretStr
 
 from marvin.settings import settings
 
 
-def get_client(api_key=None):
-    api_key = api_key or settings.openai.api_key
-    assert settings.openai.api_key == api_key
+def _resolve_api_key(api_key=None) -> str | None:
+    api_key = api_key or settings.openai.api_key or os.getenv("OPENAI_API_KEY")
+    if isinstance(api_key, SecretStr):
+        return api_key.get_secret_value()
+    return api_key
 
-    return OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
+# clients are reused per api key so the underlying httpx connection pool
+# (and its TLS sessions) is shared across calls
+@lru_cache(maxsize=8)
+def _client_for(api_key: str | None) -> OpenAI:
+    client = OpenAI(api_key=api_key)
+    atexit.register(client.close)
+    return client
 
-def get_async_client(api_key=None):
-    api_key = api_key or settings.openai.api_key
+
+@lru_cache(maxsize=8)
+def _async_client_for(api_key: str | None) -> AsyncOpenAI:
     return AsyncOpenAI(api_key=api_key)
 
 
+def get_client(api_key=None) -> OpenAI:
+    return _client_for(_resolve_api_key(api_key))
+
+
+def get_async_client(api_key=None) -> AsyncOpenAI:
+    return _async_client_for(_resolve_api_key(api_key))
+
+
 def upload_assistants_file(file: IO, name: str, purpose="assistants") -> FileObject:
     """
     Upload a file to OpenAI
     """
     client = get_client()
-    byte_content = file.read()
-    # Ensure the name is only the file name, not a full path
-    _, file_extension = os.path.splitext(name)
-    temp_suffix = file_extension or ".tmp"
-
-    # Create a temporary file
-    with tempfile.NamedTemporaryFile(delete=False, suffix=temp_suffix) as temp_file:
-        temp_file.write(byte_content)
-        temp_filename = temp_file.name
-
+    # Ensure the name is only the file name, not a full path. The SDK reads
+    # the file object as the multipart body, so no temporary copy is needed.
     try:
-        # Open the temporary file and send it to OpenAI
-        with open(temp_filename, "rb") as temp_file:
-            data = client.files.create(file=temp_file, purpose=purpose)
+        data = client.files.create(file=(os.path.basename(name), file), purpose=purpose)
     finally:
-        # Ensure the temporary file is deleted after use
-        os.remove(temp_filename)
-
-    file.close()
+        file.close()
     return data
 
 
@@ -1,28 +1,37 @@
-from typing import List
+from typing import Dict, List, Tuple
 
 import litellm
 from litellm import Usage, cost_per_token
 
 from marvin.extensions.types.costs import ServiceCosts
 
+# model -> (usd per prompt token, usd per completion token)
+_PRICE_CACHE: Dict[str, Tuple[float, float]] = {}
+
+_FALLBACK_PRICING_MODEL = "gpt-4-turbo"
+
+
+def _rates(model: str) -> Tuple[float, float]:
+    """
+    Per-token rates for a model, looked up in litellm's price map once per
+    model. Models litellm does not know are priced as gpt-4-turbo.
+    """
+    rates = _PRICE_CACHE.get(model)
+    if rates is None:
+        try:
+            rates = cost_per_token(model, 1, 1)
+        except litellm.exceptions.NotFoundError:
+            rates = cost_per_token(_FALLBACK_PRICING_MODEL, 1, 1)
+        _PRICE_CACHE[model] = rates
+    return rates
+
 
 def get_run_costs(model_response):
     """
     Run costs
     """
     try:
-        prompt_cost_usd, completion_usd = cost_per_token(
-            model_response.model,
-            model_response.usage.prompt_tokens,
-            model_response.usage.completion_tokens,
-        )
-    except litellm.exceptions.NotFoundError:
-        model_response.model = "gpt-4-turbo"
-        prompt_cost_usd, completion_usd = cost_per_token(
-            model_response.model,
-            model_response.usage.prompt_tokens,
-            model_response.usage.completion_tokens,
-        )
+        prompt_rate, completion_rate = _rates(model_response.model)
     except Exception:
         return {
             "id": model_response.id,
@@ -34,8 +43,8 @@ def get_run_costs(model_response):
             "total_tokens": 0,
         }
 
-    prompt_cost_usd_total = prompt_cost_usd * model_response.usage.prompt_tokens
-    completion_usd_total = completion_usd * model_response.usage.completion_tokens
+    prompt_cost_usd_total = prompt_rate * model_response.usage.prompt_tokens
+    completion_usd_total = completion_rate * model_response.usage.completion_tokens
 
     return {
         "id": model_response.id,
@@ -53,11 +62,9 @@ def get_service_usage_costs(usage: Usage, model: str) -> ServiceCosts:
     Calculate the service provider costs for a given usage
     """
     try:
-        prompt_cost_usd, completion_usd = cost_per_token(
-            model,
-            usage.prompt_tokens,
-            usage.completion_tokens,
-        )
+        prompt_rate, completion_rate = _rates(model)
+        prompt_cost_usd = prompt_rate * usage.prompt_tokens
+        completion_usd = completion_rate * usage.completion_tokens
         return ServiceCosts(
             prompt_cost=prompt_cost_usd,
             completion_cost=completion_usd,
@@ -75,12 +82,21 @@ def merge_run_costs(costs: List[dict]):
     """
     Sum up the run costs
     """
+    prompt_cost = completion_cost = total_cost = 0
+    prompt_tokens = completion_tokens = total_tokens = 0
+    for cost in costs:
+        prompt_cost += cost["prompt_cost"]
+        completion_cost += cost["completion_cost"]
+        total_cost += cost["total_cost"]
+        prompt_tokens += cost["prompt_tokens"]
+        completion_tokens += cost["completion_tokens"]
+        total_tokens += cost["total_tokens"]
 
     return {
-        "prompt_cost": sum(cost["prompt_cost"] for cost in costs),
-        "completion_cost": sum(cost["completion_cost"] for cost in costs),
-        "total_cost": sum(cost["total_cost"] for cost in costs),
-        "prompt_tokens": sum(cost["prompt_tokens"] for cost in costs),
-        "completion_tokens": sum(cost["completion_tokens"] for cost in costs),
-        "total_tokens": sum(cost["total_tokens"] for cost in costs),
+        "prompt_cost": prompt_cost,
+        "completion_cost": completion_cost,
+        "total_cost": total_cost,
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": total_tokens,
     }
@@ -1,17 +1,42 @@
+from binascii import b2a_base64
+from functools import lru_cache
 from io import BytesIO
-from typing import Any, List
+from typing import Any, Iterable, List
 
+# multiple of 3, so chunks encode without padding in between
+_B64_CHUNK = 261120
 
-def encode_image(image_path):
-    import base64
 
+def _b64_from_chunks(chunks: Iterable[bytes]) -> str:
+    """
+    Base64 encode a stream of byte chunks without holding the whole raw
+    payload in memory.
+    """
+    out = bytearray()
+    rest = b""
+    for data in chunks:
+        if rest:
+            data = rest + data
+        cut = len(data) - len(data) % 3
+        out += b2a_base64(data[:cut], newline=False)
+        rest = data[cut:]
+    if rest:
+        out += b2a_base64(rest, newline=False)
+    return out.decode("ascii")
+
+
+def _stream_b64(fp) -> str:
+    return _b64_from_chunks(iter(lambda: fp.read(_B64_CHUNK), b""))
+
+
+def encode_image(image_path):
     with open(image_path, "rb") as image_file:
         return {
             "url": image_path,
             "source": {
                 "type": "base64",
                 "media_type": "image/png",
-                "data": base64.b64encode(image_file.read()).decode("utf-8"),
+                "data": _stream_b64(image_file),
             },
         }
 
@@ -20,8 +45,6 @@ def encode_image_from_file(image_file: str | Any):
     """
     Also accepts django field file objects.
     """
-    import base64
-
     if hasattr(image_file, "url"):
         url = image_file.url
     else:
@@ -32,21 +55,31 @@ def encode_image_from_file(image_file: str | Any):
         "source": {
             "type": "base64",
             "media_type": image_file.file.content_type,
-            "data": base64.b64encode(image_file.read()).decode("utf-8"),
+            "data": _stream_b64(image_file),
         },
     }
 
 
-def encode_image_from_url(image_url):
-    import base64
-
+@lru_cache(maxsize=1)
+def _get_session():
     import requests
+    from requests.adapters import HTTPAdapter
+
+    # shared so bulk downloads reuse pooled connections, sized for the
+    # bulk_encode thread pool
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
-    response = requests.get(image_url)
+
+def encode_image_from_url(image_url):
+    response = _get_session().get(image_url, stream=True, timeout=30)
     return {
         "url": image_url,
         "source": {
-            "data": base64.b64encode(response.content).decode("utf-8"),
+            "data": _b64_from_chunks(response.iter_content(chunk_size=262144)),
             "media_type": response.headers["Content-Type"],
             "type": "base64",
         },
@@ -55,20 +88,30 @@ def encode_image_from_url(image_url):
 
 def bulk_encode(
     image_paths: List[str] | List[BytesIO],
+    use_processes: bool = False,
 ) -> List[str]:
     """
     Encode given images in bulk
-    Runs in a multiprocessing pool to speed up the process
+    Runs in a thread pool: downloads and base64 encoding release the GIL, and
+    threads avoid pickling inputs and results. Pass `use_processes=True` for
+    very large batches of local files.
     """
+    from concurrent.futures import ThreadPoolExecutor
     from multiprocessing import Pool
 
+    if not image_paths:
+        return []
+
     encoder = (
         encode_image_from_file
         if isinstance(image_paths[0], BytesIO)
         else encode_image_from_url
     )
 
-    with Pool() as pool:
-        images = pool.map(encoder, image_paths)
+    if use_processes:
+        with Pool() as pool:
+            return pool.map(encoder, image_paths)
+
+    with ThreadPoolExecutor(max_workers=min(32, len(image_paths))) as executor:
         # map the images to their respective paths
-        return images
+        return list(executor.map(encoder, image_paths))
@@ -1,5 +1,6 @@
 import mimetypes
 import os
+from functools import lru_cache
 from typing import BinaryIO
 
 import magic
@@ -8,8 +9,14 @@ from magika import Magika
 from marvin.extensions.utilities.logging import logger
 
 
+@lru_cache(maxsize=1)
+def _get_magika() -> Magika:
+    # loads the bundled model once per process rather than per file
+    return Magika()
+
+
 def get_magic_mimetype(file_bytes: bytes):
-    magika = Magika()
+    magika = _get_magika()
     try:
         file_type = magika.identify_bytes(file_bytes)
         mime_type = file_type.output.mime_type
@@ -37,8 +44,8 @@ def get_mime_type(file_bytes, file_name=None):
         return mime_type
     # If the MIME type couldn't be guessed based on the file extension, use python-magic
     try:
-        mime = magic.Magic(mime=True)
-        mime_type = mime.from_buffer(file_bytes)
+        # python-magic keeps one shared, locked instance per mode
+        mime_type = magic.from_buffer(file_bytes, mime=True)
 
         return mime_type
     except Exception:
@@ -1,6 +1,7 @@
 import json
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from rich import box
@@ -9,6 +10,11 @@ from rich.panel import Panel
 
 from marvin.extensions.utilities.serialization import to_serializable
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,19 +37,35 @@ def create_panel(content: Any, title: str, timestamp: int, color: str):
     )
 
 
+@lru_cache(maxsize=1)
+def _get_console() -> Console:
+    # Console() probes the terminal, do it once rather than per log line
+    return Console()
+
+
+def _dumps_pretty(data: Any) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass
+    return json.dumps(data, indent=4)
+
+
 def pretty_log(*args, propagate=False, **kwargs):
     """
     Color logger using rich.
     Propagate to the default logger if propagate is True.
     Only print if debug is True.
     """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
 
     color = kwargs.pop("color", "green")
-    console = Console()
     data = {
         "args": to_serializable(args),
         "kwargs": to_serializable(kwargs),
     }
-    message = f"DEBUG LOG: \n {json.dumps(data, indent=4)}"
+    message = f"DEBUG LOG: \n {_dumps_pretty(data)}"
     panel = create_panel(message, "DEBUG", datetime.now().timestamp(), color)
-    console.print(panel)
+    _get_console().print(panel)
@@ -1,8 +1,8 @@
 import uuid
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional, Union
 
-import orjson
 from litellm import ModelResponse
 from litellm.types.utils import Delta
 from openai.types.beta.threads import Message, MessageDelta
@@ -33,7 +33,12 @@ from marvin.extensions.types import (
     Function,
     FunctionToolCall,
 )
-from marvin.extensions.utilities.unique_id import generate_id
+from marvin.extensions.utilities.unique_id import generate_uuid_from_string
+
+# message ids are derived from the step / response id, which repeats for
+# every delta of a streamed response, the derivation is deterministic so
+# it is cached
+_message_id = lru_cache(maxsize=2048)(generate_uuid_from_string)
 
 
 def map_content_to_block(content, is_delta=False):
@@ -102,7 +107,7 @@ def construct_tool_call_from_remote_call(tool_call):
     We modify the tool call to also store structured data
     """
     if tool_call.type == "function":
-        return AppToolCall(**orjson.loads(tool_call.model_dump_json()))
+        return AppToolCall.model_validate(tool_call.model_dump())
     else:
         return tool_call
 
@@ -117,14 +122,10 @@ def patch_step_tool_calls(step: RunStep, tool_calls: List[AnyToolCall]):
 
     if step.step_details.tool_calls:
         if tool_calls:
+            # reversed so the first call with a given id wins
+            replacements = {str(tc.id): tc for tc in reversed(tool_calls)}
             for tool_call in step.step_details.tool_calls:
-                if tool_call.id in [tool_calls.id for tool_calls in tool_calls]:
-                    replacement_call = next(
-                        (tc for tc in tool_calls if str(tc.id) == str(tool_call.id)),
-                        None,
-                    )
-                    tool_call = replacement_call
-                step_tool_calls.append(tool_call)
+                step_tool_calls.append(replacements.get(str(tool_call.id), tool_call))
             return step_tool_calls
         else:
             return [
@@ -149,7 +150,7 @@ def run_step_to_tool_call_message(
     message_type = message_type_from_tool_call_step_details(details)
     # we should save tool calls
     m = ChatMessage(
-        id=generate_id("cs", run_step.id),
+        id=_message_id(str(run_step.id)),
         role="assistant",
         content=[],
         run_id=context.run_id,
@@ -198,8 +199,7 @@ def create_step_from_model_response(
             type="message_creation",
         )
 
-    if response and response.usage:
-        Usage(**response.usage.model_dump())
+    usage = Usage(**response.usage.model_dump()) if response.usage else None
     agent_id = str(uuid.uuid4())
     if context.agent_config:
         agent_id = str(context.agent_config.id) or str(uuid.uuid4())
@@ -218,8 +218,8 @@ def create_step_from_model_response(
         failed_at=None,
         last_error=None,
         step_details=step_details,
-        metadata={"message_id": generate_id("cs", str(response.id))},
-        usage=Usage(**response.usage.model_dump()),
+        metadata={"message_id": _message_id(str(response.id))},
+        usage=usage,
     )
 
 
@@ -227,11 +227,16 @@ def create_tool_calls_run_step_delta(run_step: RunStep):
     """
     Create a run step delta from a model response
     """
+    # the step was validated when it was created, so its calls are not
+    # validated again; openai's construct builds the nested function and
+    # keeps extra fields such as structured_output
     return RunStepDelta(
         step_details=ToolCallDeltaObject(
             type="tool_calls",
             tool_calls=[
-                FunctionToolCallDelta(**tool_call.model_dump(), index=idx)
+                FunctionToolCallDelta.model_construct(
+                    **tool_call.model_dump(), index=idx
+                )
                 for idx, tool_call in enumerate(run_step.step_details.tool_calls)
             ],
         )
@@ -270,10 +275,14 @@ def convert_delta_to_message_delta(delta: Delta) -> MessageDelta:
     """
     Can be one of TextDelta or ImageDelta or ToolCallsDelta
     """
+    # runs once per streamed chunk, the values are plain strings so the
+    # blocks are built without validation
     text_delta_block = None
     if delta.choices and delta.choices[0].delta.content:
-        text_delta = TextDelta(value=delta.choices[0].delta.content)
-        text_delta_block = TextDeltaBlock(index=0, type="text", text=text_delta)
-    return MessageDelta(
+        text_delta = TextDelta.model_construct(value=delta.choices[0].delta.content)
+        text_delta_block = TextDeltaBlock.model_construct(
+            index=0, type="text", text=text_delta
+        )
+    return MessageDelta.model_construct(
         content=[text_delta_block] if text_delta_block else None, role="assistant"
     )
@@ -1,6 +1,7 @@
 import inspect
 import os
 from datetime import datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 from jinja2 import Environment as JinjaEnvironment
@@ -27,6 +28,15 @@ prompt_env = JinjaEnvironment(
 prompt_env.globals.update(global_fns)
 
 
+@lru_cache(maxsize=128)
+def _compile_template(prompt: str) -> Template:
+    """
+    Compile a prompt template once. Rendering still happens per call since
+    the context (agent config, date) changes between turns.
+    """
+    return Template(prompt)
+
+
 def render_instructions(agent_config=None):
     """
     Render the system prompt with the given agent config.
@@ -35,7 +45,7 @@ def render_instructions(agent_config=None):
 
     agent_config = agent_config or AgentConfig.default_agent()
     prompt = agent_config.instructions.text or DEFAULT_PROMPT
-    t = Template(prompt)
+    t = _compile_template(prompt)
     c = {"agent_config": agent_config, "date": datetime.now().isoformat()}
     prompt_str = t.render(c)
     return prompt_str
@@ -43,7 +53,7 @@ def render_instructions(agent_config=None):
 
 def render_assistant_instructions(agent_config):
     prompt = agent_config.instructions.text or DEFAULT_ASSISTANT_PROMPT
-    t = Template(prompt)
+    t = _compile_template(prompt)
     c = {"agent_config": agent_config, "date": datetime.now().isoformat()}
     prompt_str = t.render(c)
     return prompt_str
@@ -1,12 +1,19 @@
+import functools
 import json
 from dataclasses import asdict, is_dataclass
 from datetime import date, datetime, time
+from typing import Any, Callable
 from uuid import UUID
 
 import humps
 import pydantic
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class DefaultJsonEncoder(json.JSONEncoder):
     """UUID encoder for json"""
@@ -72,9 +79,46 @@ class DefaultJsonEncoder(json.JSONEncoder):
         return json.JSONEncoder.default(self, cleaned_obj)
 
 
-def to_serializable(obj):
+_ENCODER = DefaultJsonEncoder()
+_PRIMITIVES = (str, int, float, bool, type(None))
+
+
+def _json_round_trip(obj: Any) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(
+                orjson.dumps(
+                    obj, default=_ENCODER.default, option=orjson.OPT_NON_STR_KEYS
+                )
+            )
+        except (TypeError, orjson.JSONEncodeError):
+            pass
     return json.loads(json.dumps(obj, cls=DefaultJsonEncoder))
 
 
+def _model_to_serializable(obj: BaseModel) -> Any:
+    try:
+        return obj.model_dump(mode="json")
+    except Exception:
+        return _json_round_trip(obj)
+
+
+def _identity(obj: Any) -> Any:
+    return obj
+
+
+@functools.lru_cache(maxsize=512)
+def _serializer_for(cls: type) -> Callable[[Any], Any]:
+    if cls in _PRIMITIVES:
+        return _identity
+    if issubclass(cls, BaseModel):
+        return _model_to_serializable
+    return _json_round_trip
+
+
+def to_serializable(obj):
+    return _serializer_for(type(obj))(obj)
+
+
 def camelized(obj):
     return humps.camelize(obj)
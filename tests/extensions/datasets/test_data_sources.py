@@ -115,3 +115,42 @@ def test_url_data_source():
     )
     assert data_source.upload_type == "url"
     assert str(data_source.url) == "https://example.com/data.json"
+
+
+@pytest.mark.no_llm
+def test_data_source_from_file_upload():
+    from marvin.extensions.types.data_source import DataSourceFileUpload
+
+    upload = DataSourceFileUpload(
+        file=None,
+        file_name="notes.txt",
+        file_type="text/plain",
+        file_size=12,
+        file_id="file_1",
+        file_upload_type="file",
+    )
+    data_source = DataSource.from_file_upload(upload)
+    assert data_source.name == "notes.txt"
+    assert data_source.file_id == "file_1"
+    assert data_source.upload_type == "file"
+    assert data_source.file_store_metadata.file_size == 12
+    assert data_source.id is not None
+
+
+@pytest.mark.no_llm
+def test_index_data_keeps_decoded_bytes():
+    import base64
+
+    raw = bytes(range(256))
+    encoded = base64.b64encode(raw).decode()
+    data_source = DataSource(
+        name="image.png",
+        index={"mime_type": "image/png", "base64_string": encoded},
+    )
+    assert data_source.index["base64_string"] == raw
+
+    payload = data_source.model_dump_json()
+    assert encoded in payload
+    restored = DataSource.model_validate_json(payload)
+    assert restored.index["base64_string"] == raw
+    assert DataSource(**data_source.model_dump()).index["base64_string"] == raw
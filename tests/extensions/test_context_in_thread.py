@@ -95,3 +95,28 @@ def test_thread_runner(respx_mock):
 
     current_run_id = get_current_run_id()
     assert current_run_id is None
+
+
+@pytest.mark.no_llm
+def test_get_run_context_as_class_builds_fresh_instances():
+    from marvin.extensions.context.run_context import (
+        add_run_context,
+        clear_run_context,
+    )
+
+    run_id = str(uuid.uuid4())
+    context = RunContext(run_id=run_id, stores=setup_memory_stores())
+    data = context.model_dump()
+    add_run_context(data, run_id)
+    try:
+        first = get_run_context(run_id, as_class=True)
+        assert isinstance(first, RunContext)
+        assert str(first.run_id) == run_id
+        # callers get their own instance that follows the stored dict
+        data["thread_id"] = "thread"
+        second = get_run_context(run_id, as_class=True)
+        assert second is not first
+        assert second.thread_id == "thread"
+        assert get_run_context(run_id) is data
+    finally:
+        clear_run_context(run_id)
@@ -100,3 +100,52 @@ def test_runner_message_parsing(
 
     formatted_message = format_message_for_completion_endpoint([message])
     assert len(formatted_message) == tool_call_count + 1
+
+
+@pytest.mark.no_llm
+def test_chat_message_content_dispatch():
+    from openai.types.beta.threads import ImageFileContentBlock, TextDeltaBlock
+
+    from marvin.extensions.types import FileMessageContent
+
+    message = ChatMessage(
+        content=[
+            {"type": "text", "text": {"value": "hi", "annotations": []}},
+            {"type": "text", "index": 0, "text": {"value": "h"}},
+            {"type": "image_file", "image_file": {"file_id": "file_1"}},
+            {"type": "file", "file_id": "file_2"},
+        ]
+    )
+    assert [type(c) for c in message.content] == [
+        TextContentBlock,
+        TextDeltaBlock,
+        ImageFileContentBlock,
+        FileMessageContent,
+    ]
+
+
+@pytest.mark.no_llm
+def test_tool_calls_run_step_delta_keeps_extra_fields():
+    from types import SimpleNamespace
+
+    from marvin.extensions.types.tools import AppFunction, AppToolCall
+    from marvin.extensions.utilities.mappers import create_tool_calls_run_step_delta
+
+    tool_call = AppToolCall(
+        id="call_1",
+        type="function",
+        function=AppFunction(
+            name="search",
+            arguments="{}",
+            output="done",
+            structured_output={"rows": 1},
+        ),
+    )
+    run_step = SimpleNamespace(step_details=SimpleNamespace(tool_calls=[tool_call]))
+
+    delta = create_tool_calls_run_step_delta(run_step)
+    (delta_call,) = delta.step_details.tool_calls
+    assert delta_call.index == 0
+    assert delta_call.function.name == "search"
+    assert delta_call.function.output == "done"
+    assert delta_call.model_dump()["function"]["structured_output"] == {"rows": 1}
@@ -263,3 +263,38 @@ async def test_local_run_with_tools():
     assert (
         "example.com" in json.loads(tool_calls[0].function.arguments)["url"]
     ), f"Tool call arguments are not set {tool_calls[0].function.arguments}"
+
+
+@pytest.mark.no_llm
+def test_save_run_context_data_builds_run_metadata():
+    from types import SimpleNamespace
+
+    from pydantic import ValidationError
+
+    from marvin.extensions.types.run import PersistedRun, RunMetadata
+
+    from .factories import RunFactory
+
+    metadata = {
+        "credits": {"cost": 1.0, "per_token": 0.1, "tokens": 10, "model": "gpt-4o"},
+        "events": [{"id": "event", "run_id": "run"}],
+        "messages": [{"role": "user", "content": None}],
+    }
+    run = RunFactory.build().model_dump()
+    run["metadata"] = metadata
+    context = SimpleNamespace(
+        cache=SimpleNamespace(run_metadata={"run": run, "steps": []})
+    )
+
+    persisted_run = PersistedRun(id=str(uuid4())).save_run_context_data(context)
+    assert isinstance(persisted_run.metadata, RunMetadata)
+    assert persisted_run.metadata.credits.tokens == 10
+    assert persisted_run.metadata.events[0].run_id == "run"
+    assert persisted_run.metadata.messages[0].role == MessageRole.USER
+    dumped = persisted_run.model_dump(include={"metadata"})["metadata"]
+    assert dumped["events"][0]["id"] == "event"
+
+    # data from outside the process is still validated
+    run["metadata"] = {**metadata, "credits": {"tokens": "many"}}
+    with pytest.raises(ValidationError):
+        PersistedRun(id=str(uuid4())).save_run_context_data(context, trusted=False)
@@ -0,0 +1,138 @@
+import pytest
+
+from marvin.extensions.tools.tool import ApiTool, Tool, as_tools
+
+
+def add(a: int, b: int) -> int:
+    """Add two numbers"""
+    return a + b
+
+
+@pytest.mark.no_llm
+def test_as_tools_deduplicates_tools_and_functions():
+    add_tool = Tool.from_function(add)
+    renamed = Tool.from_function(add, name="add_renamed")
+    tools = as_tools([add_tool, add, add_tool, renamed])
+
+    assert [t.name for t in tools] == ["add", "add_renamed"]
+    assert tools[0] is add_tool
+
+
+async def add_async(a: int, b: int) -> int:
+    """Add two numbers asynchronously"""
+    return a + b
+
+
+@pytest.mark.no_llm
+async def test_run_sync_and_async_tools():
+    sync_tool = Tool.from_function(add)
+    async_tool = Tool.from_function(add_async)
+
+    assert sync_tool.run({"a": 1, "b": 2}) == 3
+    assert await sync_tool.run_async({"a": 1, "b": 2}) == 3
+    assert await async_tool.run_async({"a": 1, "b": 2}) == 3
+
+
+@pytest.mark.no_llm
+def test_handle_tool_call_dispatch():
+    from marvin.extensions.tools.tool import handle_tool_call
+
+    result = handle_tool_call(
+        {"id": "call_1", "name": "add", "args": {"a": 1, "b": 2}},
+        [Tool.from_function(add)],
+    )
+    assert result.result == 3
+    assert not result.is_error
+
+    result = handle_tool_call(
+        {"id": "call_2", "name": "missing", "args": {}}, [Tool.from_function(add)]
+    )
+    assert result.is_error
+
+    with pytest.raises(ValueError):
+        as_tools([object()])
+
+
+@pytest.mark.no_llm
+async def test_handle_tool_call_async_accepts_completion_tool_calls():
+    from litellm import ChatCompletionMessageToolCall
+
+    from marvin.extensions.tools.tool import handle_tool_call_async
+
+    tool_call = ChatCompletionMessageToolCall(
+        id="call_1", function={"name": "add_async", "arguments": '{"a": 1, "b": 2}'}
+    )
+    result = await handle_tool_call_async(tool_call, [Tool.from_function(add_async)])
+    assert result.tool_call_id == "call_1"
+    assert result.result == 3
+
+
+@pytest.mark.no_llm
+def test_config_schema_is_shared_but_not_mutable():
+    from pydantic import BaseModel
+
+    class AddConfig(BaseModel):
+        offset: int = 0
+
+    first = Tool.from_function(add, config=AddConfig)
+    second = Tool.from_function(add, name="add_with_instance", config=AddConfig())
+
+    assert first.settings == second.settings
+    assert first.settings is not second.settings
+    assert "offset" in first.settings["properties"]
+
+
+@pytest.mark.no_llm
+def test_tool_metadata_fn_schema_serialization():
+    import json
+
+    from pydantic import BaseModel
+
+    from marvin.extensions.tools.types import ToolMetadata
+
+    class AddInput(BaseModel):
+        a: int
+        b: int
+
+    metadata = ToolMetadata(description="add", name="add", fn_schema=AddInput)
+    assert json.loads(metadata.fn_schema_str) == metadata.get_parameters_dict()
+    assert metadata.fn_schema_bytes.decode() == metadata.fn_schema_str
+
+
+@pytest.mark.no_llm
+def test_tool_metadata_from_dict_validates():
+    from pydantic import ValidationError
+
+    from marvin.extensions.tools.types import ToolMetadata
+
+    metadata = ToolMetadata.from_dict({"description": "add", "name": "add"})
+    assert metadata == ToolMetadata(description="add", name="add")
+    assert metadata.variables == {}
+
+    with pytest.raises(ValidationError):
+        ToolMetadata.from_dict({"name": "add"})
+
+
+@pytest.mark.no_llm
+async def test_run_awaits_coroutines_from_sync_callables():
+    def add_wrapper(a: int, b: int):
+        """Add two numbers through a sync wrapper"""
+        return add_async(a, b)
+
+    tool = Tool.from_function(add_wrapper)
+
+    assert await tool.run_async({"a": 1, "b": 2}) == 3
+
+
+@pytest.mark.no_llm
+def test_api_tool_from_tool_does_not_share_mutable_fields():
+    tool = Tool.from_function(add)
+    api_tool = ApiTool.from_tool(tool)
+
+    assert api_tool.fn is None
+    assert api_tool.parameters == tool.parameters
+    api_tool.parameters["title"] = "changed"
+    api_tool.metadata["changed"] = True
+    assert tool.parameters.get("title") != "changed"
+    assert "changed" not in tool.metadata
+    assert api_tool.model_fields_set == (tool.model_fields_set | {"fn"})
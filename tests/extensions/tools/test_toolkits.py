@@ -55,3 +55,105 @@ def test_table_tool_operations(temp_db):
     # Verify table creation
     result = run_tool("db_describe_tables", {})
     assert result["result"] is not None, result
+
+
+@pytest.mark.no_llm
+def test_toolkit_tool_lookup_cache():
+    from marvin.extensions.tools.app_tools import database_toolkit
+    from marvin.extensions.tools.tool_kit import Toolkit
+
+    toolkit = Toolkit.create_toolkit(
+        id="cache_test",
+        name="cache_test",
+        description="Toolkit used to exercise the tool lookup cache",
+        tools=database_toolkit.to_tool_list(),
+    )
+    assert toolkit.get_tool("db_query").name == "db_query"
+    assert toolkit.actions == 3
+
+    # callers get a copy, mutating it leaves the toolkit intact
+    toolkit.to_tool_list().clear()
+    assert len(toolkit.to_tool_list()) == 3
+
+    toolkit.remove_tool("db_query")
+    assert "db_query" not in toolkit.list_tools()
+    with pytest.raises(ValueError):
+        toolkit.get_tool("db_query")
+
+    toolkit.add_tool(database_toolkit.get_tool("db_query"))
+    assert toolkit.get_tool("db_query").name == "db_query"
+    assert toolkit.actions == 3
+
+    # assigning the tool fields or copying with updates drops the cache
+    toolkit.tools = [t for t in toolkit.tools if t.name != "db_query"]
+    assert "db_query" not in toolkit.list_tools()
+    copy = toolkit.model_copy(update={"tools": database_toolkit.to_tool_list()})
+    assert "db_query" in copy.list_tools()
+    assert "db_query" not in toolkit.list_tools()
+
+
+@pytest.mark.no_llm
+def test_toolkit_tool_run_is_persisted(temp_db):
+    from marvin.extensions.storage.run_store import InMemoryRunStore
+
+    set_current_tenant_id(str(uuid.uuid4()))
+    db_url, _ = temp_db
+    run_store = InMemoryRunStore()
+    result = fetch_and_run_toolkit_tool(
+        tool_id="db_list_tables",
+        toolkit_id="database",
+        config={"url": db_url, "readonly": False},
+        input_data={},
+        run_store=run_store,
+    )
+
+    run = run_store.get_run(result["run_id"])
+    assert run is not None
+    assert run.status == "completed"
+    assert run.data["outputs"]["is_error"] is False
+    assert run.data["outputs"]["str_result"] == result["result"].model_dump_json()
+
+
+@pytest.mark.no_llm
+def test_agent_config_tools_are_cached(monkeypatch):
+    from marvin.extensions.tools import helpers
+    from marvin.extensions.types.agent import AgentConfig
+
+    calls = []
+    get_agent_tools = helpers.get_agent_tools
+
+    def counting_get_agent_tools(agent_config, is_assistant=False):
+        calls.append(is_assistant)
+        return get_agent_tools(agent_config, is_assistant=is_assistant)
+
+    monkeypatch.setattr(helpers, "get_agent_tools", counting_get_agent_tools)
+
+    agent = AgentConfig(builtin_toolkits=["web_browser"])
+    tools = agent.get_tools()
+    assert [t.name for t in agent.get_tools()] == [t.name for t in tools]
+    assert calls == [False]
+    assert all(a is not b for a, b in zip(agent.get_tools(), tools))
+
+    # toolkit_config is only set when the tools are looked up again
+    agent.toolkit_config = [{"custom": True}]
+    agent.get_tools()
+    assert agent.toolkit_config == [{"custom": True}]
+
+    agent.builtin_toolkits = []
+    assert agent.get_tools() == []
+    assert calls == [False, False]
+
+
+@pytest.mark.no_llm
+def test_agent_tools_to_function_tools():
+    from marvin.extensions.types import AgentApiTool, AgentConfig
+
+    agent = AgentConfig(builtin_toolkits=["web_browser"])
+    function_tools = agent.agent_tools_to_function_tools()
+    assert function_tools
+    for tool in function_tools:
+        assert isinstance(tool, AgentApiTool)
+        assert tool.fn is None
+        assert tool.tool_id == tool.name
+        assert tool.config == {}
+        assert tool.auto_run is True